@@ -1,19 +1,43 @@
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
 import re
+import stat
 import sys
-from typing import Any
+import time
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from modules.analyzer import analyze_vocabulary, save_vocabulary
-from modules.crawler import download_episode, fetch_episode_detail, fetch_episode_list
+from modules.crawler import (
+    download_episode,
+    fetch_episode_detail,
+    fetch_episode_details,
+    fetch_episode_list,
+    shutdown_browser,
+)
+from modules.dict_cache import close_dict_caches, set_dict_cache_dir
 from modules.reporter import generate_report
 
+try:
+    import orjson  # type: ignore
+
+    _jloads = orjson.loads
+    _HAS_ORJSON = True
+except ImportError:  # stdlib json also accepts bytes
+    _jloads = json.loads
+    _HAS_ORJSON = False
+
 
 LOGGER = logging.getLogger("pipeline")
 
@@ -28,6 +52,9 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "retry_count": 3,
         "retry_delay": 1.5,
         "timeout_sec": 20,
+        "max_concurrency": 4,
+        "page_wait_until": "domcontentloaded",
+        "nav_timeout_ms": 8000,
     },
     "vocabulary": {
         "min_word_length": 4,
@@ -37,115 +64,229 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "paths": {
         "logs_dir": "logs",
         "reports_dir": "reports",
+        # Dictionary SQLite cache; gitignored, relative paths resolve against the project root.
+        "cache_dir": ".cache",
     },
 }
 
+# Pre-serialized defaults: json.loads of a cached string is much cheaper than deepcopy.
+_DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
+# Timeslot tokens identifying the 21:55 bulletin (21:55 / 10 PM / 2155).
+SLOT_TOKEN_RE = re.compile(r"21[:.]55|\b10\s*PM\b|\b2155\b", re.IGNORECASE)
+NON_DIGIT_RE = re.compile(r"[^0-9]")
+# Below this size a plain read is cheaper than setting up a mapping.
+_MMAP_MIN_BYTES = 1 << 20
+
+
+def _fresh_defaults() -> dict[str, Any]:
+    return json.loads(_DEFAULT_CONFIG_JSON)
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# Read-only defaults handed out as-is when no config override applies (no copy needed).
+_FROZEN_DEFAULTS: Mapping[str, Any] = _freeze(DEFAULT_CONFIG)
+
 
 def _deep_update(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    out = deepcopy(base)
-    for k, v in override.items():
-        if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-            out[k] = _deep_update(out[k], v)
-        else:
-            out[k] = v
+    # Iterative merge: only levels touched by `override` are cloned, the rest is shared with `base`.
+    out = dict(base)
+    if not override:
+        return out
+    stack: deque[tuple[dict[str, Any], dict[str, Any]]] = deque([(out, override)])
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if k in dst and isinstance(dst[k], dict) and isinstance(v, dict):
+                dst[k] = dict(dst[k])
+                stack.append((dst[k], v))
+            else:
+                dst[k] = v
     return out
 
 
-def _target_date_default() -> str:
-    # Pipeline default target is D-1 (KST) => YYYYMMDD
-    now = datetime.utcnow() + timedelta(hours=9)
+@lru_cache(maxsize=4)
+def _target_date_for_hour(utc_hour_bucket: int) -> str:
+    # KST is a whole-hour offset, so D-1 only changes on UTC hour boundaries.
+    now = datetime.fromtimestamp(utc_hour_bucket * 3600, timezone.utc) + timedelta(hours=9)
     d1 = now.date() - timedelta(days=1)
     return d1.strftime("%Y%m%d")
 
 
+def _target_date_default() -> str:
+    # Pipeline default target is D-1 (KST) => YYYYMMDD
+    return _target_date_for_hour(int(time.time()) // 3600)
+
+
 def _date_display(date_yyyymmdd: str) -> str:
     return f"{date_yyyymmdd[:4]}-{date_yyyymmdd[4:6]}-{date_yyyymmdd[6:8]}"
 
 
-def _bundle_paths(cfg: dict[str, Any], target_date: str) -> dict[str, Path]:
-    download_dir = Path(cfg.get("crawl", {}).get("download_path", "./downloads"))
-    logs_dir = Path(cfg.get("paths", {}).get("logs_dir", "logs"))
-    reports_dir = Path(cfg.get("paths", {}).get("reports_dir", "reports"))
+@lru_cache(maxsize=16)
+def _bundle_paths_cached(
+    download_path: str, logs_path: str, reports_path: str, target_date: str
+) -> Mapping[str, Path]:
+    download_dir = Path(download_path)
+    logs_dir = Path(logs_path)
+    reports_dir = Path(reports_path)
     stem = f"{target_date}_2155_arirang"
-    return {
-        "download_dir": download_dir,
-        "logs_dir": logs_dir,
-        "reports_dir": reports_dir,
-        "txt": download_dir / f"{stem}.txt",
-        "mp3": download_dir / f"{stem}.mp3",
-        "meta": download_dir / f"{stem}_meta.json",
-        "vocab_json": logs_dir / f"vocabulary_{target_date}.json",
-        "vocab_csv": logs_dir / f"vocabulary_{target_date}.csv",
-        "report": reports_dir / f"report_{target_date}_2155.html",
-    }
+    return MappingProxyType(
+        {
+            "download_dir": download_dir,
+            "logs_dir": logs_dir,
+            "reports_dir": reports_dir,
+            "txt": download_dir / f"{stem}.txt",
+            "mp3": download_dir / f"{stem}.mp3",
+            "meta": download_dir / f"{stem}_meta.json",
+            "vocab_json": logs_dir / f"vocabulary_{target_date}.json",
+            "vocab_csv": logs_dir / f"vocabulary_{target_date}.csv",
+            "report": reports_dir / f"report_{target_date}_2155.html",
+        }
+    )
+
 
+def _bundle_paths(cfg: dict[str, Any], target_date: str) -> Mapping[str, Path]:
+    """Return the read-only path bundle for `target_date` (memoized per settings)."""
 
-def load_config(config_path: str | Path) -> dict[str, Any]:
+    return _bundle_paths_cached(
+        str(cfg.get("crawl", {}).get("download_path", "./downloads")),
+        str(cfg.get("paths", {}).get("logs_dir", "logs")),
+        str(cfg.get("paths", {}).get("reports_dir", "reports")),
+        target_date,
+    )
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, mtime, size); edits invalidate the entry."""
+
+    import yaml  # type: ignore
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path_str).read_text(encoding="utf-8"), Loader=loader) or {}
+
+
+def load_config(config_path: str | Path) -> Mapping[str, Any]:
     """Load YAML config and merge with defaults.
 
-    If config file is missing or unreadable, returns hardcoded defaults.
+    If config file is missing or unreadable, returns the hardcoded defaults
+    as a read-only mapping (callers only read the config).
     """
 
     cfg_path = Path(config_path)
     if not cfg_path.exists():
         LOGGER.warning("Config not found: %s. Using defaults.", cfg_path)
-        return deepcopy(DEFAULT_CONFIG)
+        return _FROZEN_DEFAULTS
 
     try:
-        import yaml  # type: ignore
+        import yaml  # type: ignore  # noqa: F401
     except ImportError:
         LOGGER.warning("PyYAML not installed. Using defaults only.")
-        return deepcopy(DEFAULT_CONFIG)
+        return _FROZEN_DEFAULTS
 
     try:
-        loaded = yaml.safe_load(cfg_path.read_text(encoding="utf-8")) or {}
+        st = cfg_path.stat()
+        loaded = _parse_yaml_cached(str(cfg_path), st.st_mtime_ns, st.st_size)
+        if not loaded:
+            # Empty yaml (None / {}): nothing to merge.
+            return _FROZEN_DEFAULTS
         if not isinstance(loaded, dict):
             LOGGER.warning("Config format invalid. Using defaults.")
-            return deepcopy(DEFAULT_CONFIG)
-        merged = _deep_update(DEFAULT_CONFIG, loaded)
+            return _FROZEN_DEFAULTS
+        # The cached parse is shared across calls; never hand out its nested objects.
+        merged = _deep_update(_fresh_defaults(), deepcopy(loaded))
         return merged
     except Exception as exc:  # noqa: BLE001
         LOGGER.warning("Failed to parse config (%s). Using defaults.", exc)
-        return deepcopy(DEFAULT_CONFIG)
+        return _FROZEN_DEFAULTS
+
+
+def _hhmm_key(airtime: str) -> str:
+    """Sortable "HHMM" for an "HH:MM" airtime; "0000" for anything else."""
+
+    # Plain slicing for the HH:MM shape; no regex needed per candidate.
+    hh, sep, mm = airtime[:2], airtime[2:3], airtime[3:]
+    if len(airtime) == 5 and sep == ":" and hh.isdigit() and mm.isdigit():
+        return hh + mm
+    return "0000"
+
+
+def _select_index_for_date(episodes: list[dict[str, Any]], target_date: str) -> tuple[int, bool] | None:
+    """Return (index, token_matched) of the episode chosen for `target_date`."""
+
+    # Single pass: first timeslot-token hit wins; otherwise keep the latest HH:MM seen.
+    best_hhmm = ""
+    latest: int | None = None
+    for idx, ep in enumerate(episodes):
+        if str(ep.get("date_str", "")) != target_date:
+            continue
+        title = str(ep.get("title", ""))
+        airtime = str(ep.get("airtime", ""))
+        if SLOT_TOKEN_RE.search(title) or SLOT_TOKEN_RE.search(airtime):
+            return idx, True
+        key = _hhmm_key(airtime)
+        if key > best_hhmm:
+            best_hhmm, latest = key, idx
+    return None if latest is None else (latest, False)
 
 
 def _select_episode_for_date(episodes: list[dict[str, Any]], target_date: str) -> dict[str, Any] | None:
-    d1 = [e for e in episodes if str(e.get("date_str", "")) == target_date]
-    if not d1:
+    picked = _select_index_for_date(episodes, target_date)
+    if picked is None:
         LOGGER.warning("No episode candidates for target date=%s", target_date)
         return None
 
-    token_patterns = [r"21[:.]55", r"\b10\s*PM\b", r"\b2155\b"]
-
-    def has_token(ep: dict[str, Any]) -> bool:
-        text = f"{ep.get('title', '')} {ep.get('airtime', '')}"
-        return any(re.search(pat, text, flags=re.IGNORECASE) for pat in token_patterns)
-
-    matched = [e for e in d1 if has_token(e)]
-    if matched:
-        chosen = matched[0]
+    idx, token_matched = picked
+    ep = episodes[idx]
+    if token_matched:
         LOGGER.info(
             "Selection rule: D-1 + target timeslot token matched (21:55/10 PM/2155). url=%s",
-            chosen.get("detail_url", ""),
+            ep.get("detail_url", ""),
         )
-        return chosen
+    else:
+        LOGGER.info(
+            "Selection rule: no explicit target token; selected latest episode in date=%s airtime=%s",
+            target_date,
+            ep.get("airtime", ""),
+        )
+    return ep
 
-    def hhmm(ep: dict[str, Any]) -> str:
-        t = str(ep.get("airtime", ""))
-        if re.fullmatch(r"\d{2}:\d{2}", t):
-            return t.replace(":", "")
-        return "0000"
 
-    chosen = sorted(d1, key=hhmm, reverse=True)[0]
-    LOGGER.info(
-        "Selection rule: no explicit target token; selected latest episode in date=%s airtime=%s",
-        target_date,
-        chosen.get("airtime", ""),
-    )
-    return chosen
+def _download_selected(
+    cfg: dict[str, Any],
+    target_date: str,
+    detailed: dict[str, Any],
+    paths: Mapping[str, Path] | None = None,
+) -> dict[str, Any]:
+    """Download a detail-fetched episode and stamp the pipeline's date/file fields."""
+
+    # Keep output filename/date matching the requested pipeline date.
+    # This prevents fallback media inference from drifting to a previous day.
+    detailed["date_str"] = target_date
+    downloaded = download_episode(detailed, cfg)
 
+    if paths is None:
+        paths = _bundle_paths(cfg, target_date)
+    downloaded["txt_filename"] = paths["txt"].name
+    if not downloaded.get("mp3_filename"):
+        downloaded["mp3_filename"] = paths["mp3"].name
+    downloaded["date"] = _date_display(target_date)
+    downloaded["airtime"] = "21:55"
+    return downloaded
 
-def step_crawl(cfg: dict[str, Any], target_date: str) -> dict[str, Any] | None:
+
+def step_crawl(
+    cfg: dict[str, Any],
+    target_date: str,
+    paths: Mapping[str, Path] | None = None,
+) -> dict[str, Any] | None:
     """Run crawl step: list -> detail -> download.
 
     Returns selected episode dict on success, or None when not found.
@@ -157,27 +298,73 @@ def step_crawl(cfg: dict[str, Any], target_date: str) -> dict[str, Any] | None:
         return None
 
     detailed = fetch_episode_detail(episode, cfg)
-    # Keep output filename/date matching the requested pipeline date.
-    # This prevents fallback media inference from drifting to a previous day.
-    detailed["date_str"] = target_date
-    downloaded = download_episode(detailed, cfg)
+    return _download_selected(cfg, target_date, detailed, paths)
 
-    paths = _bundle_paths(cfg, target_date)
-    downloaded["txt_filename"] = paths["txt"].name
-    if not downloaded.get("mp3_filename"):
-        downloaded["mp3_filename"] = paths["mp3"].name
-    downloaded["date"] = _date_display(target_date)
-    downloaded["airtime"] = "21:55"
-    return downloaded
+
+def step_crawl_many(cfg: dict[str, Any], target_dates: list[str]) -> dict[str, dict[str, Any] | None]:
+    """Run crawl step for several dates (backfill).
+
+    The episode list is fetched once and every date is selected from it; the
+    selected episodes are detail-fetched as one batch (shared browser), then
+    downloads overlap on a thread pool bounded by `crawl.max_concurrency`.
+    Returns {date: episode or None}; per-date failures are logged, not raised.
+    """
+
+    results: dict[str, dict[str, Any] | None] = {d: None for d in target_dates}
+    if not target_dates:
+        return results
+    try:
+        episodes = fetch_episode_list(cfg)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("[BACKFILL] episode list fetch failed: %s", exc)
+        return results
+
+    selected = {d: _select_episode_for_date(episodes, d) for d in target_dates}
+    wanted = [d for d in target_dates if selected[d]]
+    if not wanted:
+        return results
+    try:
+        details = fetch_episode_details([selected[d] for d in wanted], cfg)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("[BACKFILL] detail fetch failed dates=%s: %s", ",".join(wanted), exc)
+        return results
+
+    max_workers = max(1, int(cfg.get("crawl", {}).get("max_concurrency", 4)))
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(wanted))) as pool:
+        futures = {d: pool.submit(_download_selected, cfg, d, detailed) for d, detailed in zip(wanted, details)}
+
+    for d, fut in futures.items():
+        try:
+            results[d] = fut.result()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("[BACKFILL] crawl failed date=%s: %s", d, exc)
+    return results
 
 
-def _load_episode_from_meta(cfg: dict[str, Any], target_date: str) -> dict[str, Any]:
-    paths = _bundle_paths(cfg, target_date)
+def _load_episode_from_meta(
+    cfg: dict[str, Any],
+    target_date: str,
+    paths: Mapping[str, Path] | None = None,
+) -> dict[str, Any]:
+    if paths is None:
+        paths = _bundle_paths(cfg, target_date)
     meta_path = paths["meta"]
-    if not meta_path.exists():
-        raise FileNotFoundError(f"Meta file not found: {meta_path}")
+    try:
+        f = meta_path.open("rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Meta file not found: {meta_path}") from None
 
-    episode = json.loads(meta_path.read_text(encoding="utf-8"))
+    with f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            episode = _jloads(f.read())
+        else:
+            # Large meta (long scripts): parse straight from the page cache.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _HAS_ORJSON:
+                    with memoryview(mm) as mv:
+                        episode = _jloads(mv)
+                else:
+                    episode = _jloads(mm[:])
     episode["txt_path"] = str(paths["txt"])
     episode["mp3_path"] = str(paths["mp3"])
     episode["meta_path"] = str(paths["meta"])
@@ -185,6 +372,25 @@ def _load_episode_from_meta(cfg: dict[str, Any], target_date: str) -> dict[str,
     return episode
 
 
+@lru_cache(maxsize=4)
+def _read_script(path_str: str, mtime_ns: int) -> str:
+    """Decode a script txt once so analyze and report share the same string."""
+
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def _try_read_script(path: Path) -> str | None:
+    """Read a script txt with a single stat; None when it is missing."""
+
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _read_script(str(path), st.st_mtime_ns)
+
+
 def step_analyze(episode: dict[str, Any], cfg: dict[str, Any]) -> tuple[list[dict[str, Any]], tuple[str, str]]:
     """Run analyze step using script text or fallback txt file."""
 
@@ -192,20 +398,22 @@ def step_analyze(episode: dict[str, Any], cfg: dict[str, Any]) -> tuple[list[dic
 
     if not script_text:
         txt_path = Path(str(episode.get("txt_path", "") or ""))
-        if not txt_path.exists():
+        text = _try_read_script(txt_path)
+        if text is None:
             # fallback from filename rule
-            date_digits = re.sub(r"[^0-9]", "", str(episode.get("date", "")))[:8]
+            date_digits = NON_DIGIT_RE.sub("", str(episode.get("date", "")))[:8]
             if not date_digits:
                 raise FileNotFoundError("No script_text and no txt_path available")
             txt_path = _bundle_paths(cfg, date_digits)["txt"]
+            text = _try_read_script(txt_path)
 
-        if not txt_path.exists():
+        if text is None:
             raise FileNotFoundError(f"Script txt not found: {txt_path}")
-        script_text = txt_path.read_text(encoding="utf-8")
+        script_text = text
 
     vocab_data = analyze_vocabulary(script_text, cfg)
 
-    date_digits = re.sub(r"[^0-9]", "", str(episode.get("date", "")))[:8]
+    date_digits = NON_DIGIT_RE.sub("", str(episode.get("date", "")))[:8]
     if not date_digits:
         # final fallback: today KST D-1
         date_digits = _target_date_default()
@@ -219,63 +427,68 @@ def step_report(episode: dict[str, Any], vocab_data: list[dict[str, Any]], cfg:
 
     script_text = str(episode.get("script_text", "") or "").strip()
     if not script_text:
-        txt_path = Path(str(episode.get("txt_path", "") or ""))
-        if not txt_path.exists():
+        text = _try_read_script(Path(str(episode.get("txt_path", "") or "")))
+        if text is None:
             txt_filename = str(episode.get("txt_filename", "") or "")
             if txt_filename:
-                txt_path = Path(cfg.get("crawl", {}).get("download_path", "./downloads")) / txt_filename
-        if txt_path.exists():
-            episode["script_text"] = txt_path.read_text(encoding="utf-8")
+                text = _try_read_script(Path(cfg.get("crawl", {}).get("download_path", "./downloads")) / txt_filename)
+        if text is not None:
+            episode["script_text"] = text
 
     return generate_report(episode, vocab_data, cfg)
 
 
 def _load_vocab_from_json(path: Path) -> list[dict[str, Any]]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = _jloads(path.read_bytes())
     items = payload.get("items", [])
     if not isinstance(items, list):
         return []
     return items
 
 
-def run_pipeline(cfg: dict[str, Any], target_date: str, step: str | None) -> None:
+def run_pipeline(cfg: dict[str, Any], target_date: str, step: str | None) -> int:
     """Run pipeline stages.
 
     If `step` is provided, run only that stage.
-    On failure exits with status 1.
+    Returns 0 on success and 1 on failure.
     """
 
     try:
         episode: dict[str, Any] | None = None
         vocab_data: list[dict[str, Any]] = []
+        paths = _bundle_paths(cfg, target_date)
 
         if step in (None, "crawl"):
             LOGGER.info("[STEP] crawl start")
-            episode = step_crawl(cfg, target_date)
+            episode = step_crawl(cfg, target_date, paths)
             if episode is None:
                 LOGGER.error("[STEP] crawl failed: no matching episode")
-                sys.exit(1)
+                return 1
             LOGGER.info("[STEP] crawl success")
             if step == "crawl":
-                return
+                return 0
+            # Full run: attach the saved script once so analyze/report never re-read the txt.
+            script_text = _try_read_script(paths["txt"])
+            if script_text is not None:
+                episode["script_text"] = script_text
 
         if step == "analyze":
             LOGGER.info("[STEP] analyze start")
-            episode = _load_episode_from_meta(cfg, target_date)
+            episode = _load_episode_from_meta(cfg, target_date, paths)
             vocab_data, save_paths = step_analyze(episode, cfg)
             LOGGER.info("[STEP] analyze success json=%s csv=%s count=%d", save_paths[0], save_paths[1], len(vocab_data))
-            return
+            return 0
 
         if step == "report":
             LOGGER.info("[STEP] report start")
-            episode = _load_episode_from_meta(cfg, target_date)
-            paths = _bundle_paths(cfg, target_date)
-            if not paths["vocab_json"].exists():
-                raise FileNotFoundError(f"Vocabulary JSON not found: {paths['vocab_json']}")
-            vocab_data = _load_vocab_from_json(paths["vocab_json"])
+            episode = _load_episode_from_meta(cfg, target_date, paths)
+            try:
+                vocab_data = _load_vocab_from_json(paths["vocab_json"])
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Vocabulary JSON not found: {paths['vocab_json']}") from None
             out = step_report(episode, vocab_data, cfg)
             LOGGER.info("[STEP] report success path=%s", out)
-            return
+            return 0
 
         # Full run (step is None)
         if episode is None:
@@ -288,12 +501,37 @@ def run_pipeline(cfg: dict[str, Any], target_date: str, step: str | None) -> Non
         LOGGER.info("[STEP] report start")
         out = step_report(episode, vocab_data, cfg)
         LOGGER.info("[STEP] report success path=%s", out)
+        return 0
 
-    except SystemExit:
-        raise
     except Exception as exc:  # noqa: BLE001
         LOGGER.exception("Pipeline failed: %s", exc)
-        sys.exit(1)
+        return 1
+
+
+def run_backfill(cfg: dict[str, Any], target_dates: list[str]) -> int:
+    """Crawl several dates concurrently, then analyze/report each in order.
+
+    Returns 1 if any date failed (after processing the rest), else 0.
+    """
+
+    LOGGER.info("[BACKFILL] crawl start dates=%s", ",".join(target_dates))
+    episodes = step_crawl_many(cfg, target_dates)
+    failed = False
+    for d in target_dates:
+        episode = episodes.get(d)
+        if episode is None:
+            LOGGER.error("[BACKFILL] date=%s crawl failed: no matching episode", d)
+            failed = True
+            continue
+        try:
+            vocab_data, save_paths = step_analyze(episode, cfg)
+            LOGGER.info("[BACKFILL] date=%s analyze success json=%s count=%d", d, save_paths[0], len(vocab_data))
+            out = step_report(episode, vocab_data, cfg)
+            LOGGER.info("[BACKFILL] date=%s report success path=%s", d, out)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.exception("[BACKFILL] date=%s failed: %s", d, exc)
+            failed = True
+    return 1 if failed else 0
 
 
 def run_demo(cfg: dict[str, Any]) -> None:
@@ -337,26 +575,69 @@ def run_demo(cfg: dict[str, Any]) -> None:
     LOGGER.info("[DEMO] report success path=%s", out)
 
 
-def _setup_logging(target_date: str, cfg: dict[str, Any]) -> None:
+def _ensure_dirs(cfg: Mapping[str, Any]) -> dict[str, Any]:
+    """Create download/logs/reports dirs once and mark the config as `dirs_ready`.
+
+    Returns a shallow copy so read-only default configs are never mutated.
+    """
+
+    crawl_cfg = cfg.get("crawl", {})
+    paths_cfg = cfg.get("paths", {})
+    for p in (
+        crawl_cfg.get("download_path", "./downloads"),
+        paths_cfg.get("logs_dir", "logs"),
+        paths_cfg.get("reports_dir", "reports"),
+    ):
+        Path(p).mkdir(parents=True, exist_ok=True)
+    return {**cfg, "dirs_ready": True}
+
+
+class _EarlyLogBuffer(logging.Handler):
+    """Keep every record emitted before the log file path is known (never drops)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _setup_logging(target_date: str, cfg: dict[str, Any], early: _EarlyLogBuffer | None = None) -> None:
+    """Attach stdout + file handlers, replaying records held in `early`."""
+
     logs_dir = Path(cfg.get("paths", {}).get("logs_dir", "logs"))
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    if not cfg.get("dirs_ready"):
+        logs_dir.mkdir(parents=True, exist_ok=True)
     log_path = logs_dir / f"pipeline_{target_date}.log"
 
-    fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    logging.basicConfig(
-        level=logging.INFO,
-        format=fmt,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_path, encoding="utf-8"),
-        ],
-    )
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    # Unbuffered on purpose: the workflow greps this file, and a CI timeout or kill
+    # must not lose INFO records that were still held in memory.
+
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        root.removeHandler(h)
+    root.setLevel(logging.INFO)
+    root.addHandler(stream_handler)
+    root.addHandler(file_handler)
+
+    if early is not None:
+        for record in early.records:
+            stream_handler.handle(record)
+            file_handler.handle(record)
+        early.close()
 
 
 def _parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Arirang Learner pipeline orchestrator")
     p.add_argument("--date", default="", help="Run target date (YYYYMMDD)")
     p.add_argument("--step", choices=["crawl", "analyze", "report"], default=None)
+    p.add_argument("--dates", default="", help="Backfill target dates, comma separated (YYYYMMDD,...)")
     p.add_argument("--demo", action="store_true", help="Run demo mode without crawling")
     p.add_argument("--config", default="config.yaml", help="Config file path")
     return p.parse_args()
@@ -366,21 +647,30 @@ if __name__ == "__main__":
     args = _parse_args()
     target_date = args.date or _target_date_default()
 
-    # Load config first with lightweight fallback logging.
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-    cfg = load_config(args.config)
+    # Buffer records emitted while loading config until the log file path is known.
+    early_handler = _EarlyLogBuffer()
+    logging.getLogger().addHandler(early_handler)
+    logging.getLogger().setLevel(logging.INFO)
+    cfg = _ensure_dirs(load_config(args.config))
+    # Point every dictionary cache user (analyzer and modules.dictionary) at the same SQLite file.
+    set_dict_cache_dir(cfg.get("paths", {}).get("cache_dir"))
 
-    # Reconfigure with file handler.
-    for h in list(logging.getLogger().handlers):
-        logging.getLogger().removeHandler(h)
-    _setup_logging(target_date, cfg)
+    _setup_logging(target_date, cfg, early_handler)
 
     LOGGER.info("Pipeline start date=%s step=%s demo=%s", target_date, args.step, args.demo)
-    if args.demo:
-        try:
-            run_demo(cfg)
-        except Exception as exc:  # noqa: BLE001
-            LOGGER.exception("Demo failed: %s", exc)
-            sys.exit(1)
-    else:
-        run_pipeline(cfg, target_date=target_date, step=args.step)
+    try:
+        if args.demo:
+            try:
+                run_demo(cfg)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.exception("Demo failed: %s", exc)
+                sys.exit(1)
+        elif args.dates:
+            sys.exit(run_backfill(cfg, [d.strip() for d in args.dates.split(",") if d.strip()]))
+        else:
+            sys.exit(run_pipeline(cfg, target_date=target_date, step=args.step))
+    finally:
+        # Close the shared Chromium deterministically instead of relying on atexit ordering.
+        shutdown_browser()
+        # Checkpoint and close the dictionary cache so no -wal/-shm files are left behind.
+        close_dict_caches()
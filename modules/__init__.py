@@ -1,22 +1,43 @@
-﻿"""Core module exports for arirang_learner."""
-
-from .analyzer import analyze_vocabulary, save_vocabulary
-from .crawler import _get_target_date, download_episode, fetch_episode_detail, fetch_episode_list
-from .dictionary import get_english_definition, get_korean_meaning
-from .file_rules import BuildFiles, build_file_bundle, validate_bundle
-from .reporter import generate_report
-
-__all__ = [
-    "BuildFiles",
-    "_get_target_date",
-    "analyze_vocabulary",
-    "build_file_bundle",
-    "download_episode",
-    "fetch_episode_detail",
-    "fetch_episode_list",
-    "generate_report",
-    "get_english_definition",
-    "get_korean_meaning",
-    "save_vocabulary",
-    "validate_bundle",
-]
+﻿"""Core module exports for arirang_learner.
+
+Submodules are imported lazily (PEP 562) so a step only pays for the
+dependencies it actually uses.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, str] = {
+    "BuildFiles": ".file_rules",
+    "_get_target_date": ".crawler",
+    "analyze_vocabulary": ".analyzer",
+    "build_file_bundle": ".file_rules",
+    "download_episode": ".crawler",
+    "fetch_episode_detail": ".crawler",
+    "fetch_episode_details": ".crawler",
+    "fetch_episode_list": ".crawler",
+    "generate_report": ".reporter",
+    "get_english_definition": ".dictionary",
+    "get_english_definitions": ".dictionary",
+    "get_korean_meaning": ".dictionary",
+    "save_vocabulary": ".analyzer",
+    "shutdown_browser": ".crawler",
+    "validate_bundle": ".file_rules",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
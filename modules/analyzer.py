@@ -2,29 +2,57 @@
 
 Priority strategy:
 1) NLTK WordNet (offline)
-2) PyDictionary
-3) Free Dictionary API (no-auth REST, best-effort)
-4) Korean meaning from OMW (or empty)
+2) Free Dictionary API (no-auth REST, best-effort)
+3) Korean meaning from OMW (or empty)
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from datetime import datetime
+from functools import lru_cache
+import heapq
 import html
 import json
 import logging
+import math
 import os
 from pathlib import Path
 import re
-import time
-from typing import Any
+import threading
+from typing import Any, Mapping
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .dict_cache import DictCache, dict_cache_path, get_dict_cache
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+try:
+    import re2 as _re2  # type: ignore
+except ImportError:
+    _re2 = None
 
 
 LOGGER = logging.getLogger(__name__)
 
+FREE_DICT_API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{lemma}"
+FREE_DICT_MAX_WORKERS = 8
+COMMON_WORDS_TOP_N = 10_000
+RARE_SCORE_THRESHOLD = 5.0
+
+_HTTP_SESSION: requests.Session | None = None
+_HTTP_SESSION_LOCK = threading.Lock()
+# NLTK's WordNet reader seeks/reads a shared file handle without locking; serialise lookups.
+_WORDNET_LOCK = threading.Lock()
+_NLTK_READY = False
+
 POS_KO_MAP = {
     "NOUN": "\uba85\uc0ac",
     "VERB": "\ub3d9\uc0ac",
@@ -33,7 +61,7 @@ POS_KO_MAP = {
 }
 
 # Hardcoded B2+ current-affairs vocabulary (100 words).
-B2_PLUS_NEWS_WORDS = {
+B2_PLUS_NEWS_WORDS = frozenset({
     "acquisition",
     "allegation",
     "amendment",
@@ -135,13 +163,36 @@ B2_PLUS_NEWS_WORDS = {
     "unilateral",
     "volatile",
     "withdrawal",
-}
+})
+
+
+def _compile_linear(pattern: str) -> Any:
+    """Compile with re2 (linear-time, no backtracking) when installed, else stdlib re."""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except Exception:  # noqa: BLE001
+            pass
+    return re.compile(pattern)
+
+
+# Script sanitize / tokenize patterns (compiled once).
+# One pass strips leaked data-* attrs (quoted/unquoted, incl. smart quotes) and any HTML tag.
+SCRIPT_MARKUP_RE = _compile_linear(
+    r"(?i)\bdata-[a-z-]+\s*=\s*(?:'[^']*'|\"[^\"]*\"|’[^’]*’|[^\s>]+)\s*(?:>|&gt;)?|<[^>]+>"
+)
+INLINE_WS_RE = re.compile(r"[ \t]+")
+MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+SENTENCE_END_RE = re.compile(r"[.!?]\s+")
+TOKEN_RE = re.compile(r"\b[a-zA-Z][a-zA-Z'-]+\b")
+UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+CR_TO_LF = str.maketrans("\r", "\n")
 
 
 def _cfg_get(cfg: dict[str, Any], path: str, default: Any) -> Any:
     cur: Any = cfg
     for key in path.split("."):
-        if not isinstance(cur, dict) or key not in cur:
+        if not isinstance(cur, Mapping) or key not in cur:
             return default
         cur = cur[key]
     return cur
@@ -149,27 +200,26 @@ def _cfg_get(cfg: dict[str, Any], path: str, default: Any) -> Any:
 
 def _sanitize_script_text(script_text: str) -> str:
     """Remove crawler/page markup residue before NLP analysis."""
-    text = html.unescape((script_text or "").replace("\r\n", "\n").replace("\r", "\n"))
+    text = script_text or ""
+    # Clean input (no CR, no entities) skips both normalization passes.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").translate(CR_TO_LF)
+    if "&" in text:
+        text = html.unescape(text)
     if not text.strip():
         return ""
-    # Remove leaked inline attrs such as data-lemma='word'> that appear as plain text.
-    # Remove leaked inline attrs (quoted/unquoted, including smart quotes).
-    text = re.sub(
-        r"\bdata-[a-z-]+\s*=\s*(?:'[^']*'|\"[^\"]*\"|’[^’]*’|[^\s>]+)\s*(?:>|&gt;)?",
-        "",
-        text,
-        flags=re.IGNORECASE,
-    )
-    # Remove any remaining HTML tags.
-    text = re.sub(r"</?mark[^>]*>", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", "", text)
+    # Remove leaked inline attrs such as data-lemma='word'> that appear as plain text,
+    # plus any remaining HTML tags (<mark> included), in a single scan.
+    text = SCRIPT_MARKUP_RE.sub("", text)
     # Normalize whitespace.
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = INLINE_WS_RE.sub(" ", text)
+    text = MULTI_NEWLINE_RE.sub("\n\n", text)
     return text.strip()
 
 
+@lru_cache(maxsize=1)
 def _load_dependencies() -> dict[str, Any]:
+    """Import optional NLP deps once per process (result is shared; do not mutate)."""
     deps: dict[str, Any] = {}
 
     try:
@@ -195,22 +245,21 @@ def _load_dependencies() -> dict[str, Any]:
         deps["spacy"] = None
 
     try:
-        from wordfreq import word_frequency  # type: ignore
+        from wordfreq import top_n_list, word_frequency  # type: ignore
 
         deps["word_frequency"] = word_frequency
+        deps["top_n_list"] = top_n_list
     except ImportError:
         LOGGER.warning("wordfreq not installed. Using heuristic frequency fallback.")
         deps["word_frequency"] = None
-
-    # Keep dictionary source policy deterministic:
-    # WordNet (offline) -> Free Dictionary API -> blank.
-    deps["PyDictionary"] = None
+        deps["top_n_list"] = None
 
     return deps
 
 
 def _ensure_nltk_data(nltk_mod: Any) -> None:
-    if nltk_mod is None:
+    global _NLTK_READY
+    if nltk_mod is None or _NLTK_READY:
         return
     # Use project-local NLTK data dir to avoid permission issues on user profile paths.
     local_nltk_dir = Path(__file__).resolve().parents[1] / ".nltk_data"
@@ -231,6 +280,20 @@ def _ensure_nltk_data(nltk_mod: Any) -> None:
                 nltk_mod.download(pkg, quiet=True, download_dir=str(local_nltk_dir))
             except Exception:  # noqa: BLE001
                 LOGGER.warning("Failed to download NLTK corpus: %s", pkg)
+    _NLTK_READY = True
+
+
+@lru_cache(maxsize=100_000)
+def _word_frequency(lemma: str, word_frequency_fn: Any) -> float:
+    return float(word_frequency_fn(lemma, "en"))
+
+
+@lru_cache(maxsize=50_000)
+def _morphy(word: str, pos: str, wn: Any) -> str | None:
+    try:
+        return wn.morphy(word, pos=pos)
+    except Exception:  # noqa: BLE001
+        return None
 
 
 def _frequency_score(lemma: str, word_frequency_fn: Any) -> float:
@@ -238,15 +301,33 @@ def _frequency_score(lemma: str, word_frequency_fn: Any) -> float:
         # fallback: longer words are treated as rarer.
         return max(1.0, min(8.0, len(lemma) / 1.2))
 
-    freq = float(word_frequency_fn(lemma, "en"))
+    freq = _word_frequency(lemma, word_frequency_fn)
     if freq <= 0:
         return 8.0
     # Rare-word score = -log10(freq)
-    import math
-
     return round(-math.log10(freq), 4)
 
 
+@lru_cache(maxsize=1)
+def _common_words(top_n_list_fn: Any, word_frequency_fn: Any) -> frozenset[str]:
+    """Most frequent English words that are certain to score below the rare-word cutoff."""
+    if top_n_list_fn is None or word_frequency_fn is None:
+        return frozenset()
+    try:
+        words = top_n_list_fn("en", COMMON_WORDS_TOP_N)
+    except Exception:  # noqa: BLE001
+        return frozenset()
+    # top_n_list is frequency-ordered, so the score rises with the index: binary-search the
+    # first word that could pass the cutoff (~log2(N) lookups) instead of scoring the prefix.
+    def _may_pass_cutoff(i: int) -> bool:
+        # Raw lookup: these few probes should not crowd the per-lemma frequency cache.
+        freq = float(word_frequency_fn(words[i], "en"))
+        return freq <= 0 or -math.log10(freq) >= RARE_SCORE_THRESHOLD
+
+    cut = bisect_left(range(len(words)), True, key=_may_pass_cutoff)
+    return frozenset(words[:cut])
+
+
 def _estimate_cefr(score: float) -> str:
     if score >= 7.0:
         return "C2"
@@ -281,12 +362,9 @@ def _get_wordnet_info(lemma: str, wn: Any) -> dict[str, Any]:
         examples = first.examples() or []
         out["example_en"] = examples[0] if examples else ""
 
-        derivs: set[str] = set()
-        for syn in synsets[:5]:
-            for l in syn.lemmas():
-                derivs.add(l.name().replace("_", " "))
+        derivs = {l.name().translate(UNDERSCORE_TO_SPACE) for syn in synsets[:5] for l in syn.lemmas()}
         derivs.discard(lemma)
-        out["derivatives"] = sorted(derivs)[:15]
+        out["derivatives"] = heapq.nsmallest(15, derivs)
 
     # OMW korean lookup
     try:
@@ -299,87 +377,103 @@ def _get_wordnet_info(lemma: str, wn: Any) -> dict[str, Any]:
         except Exception:  # noqa: BLE001
             ko_names = []
         if ko_names:
-            out["translation_ko"] = ko_names[0].replace("_", " ")
+            out["translation_ko"] = ko_names[0].translate(UNDERSCORE_TO_SPACE)
+
+    return out
+
+
+@lru_cache(maxsize=50_000)
+def _wordnet_info_cached(lemma: str, wn: Any) -> dict[str, Any]:
+    """Shared per-process WordNet lookup (result is shared; do not mutate)."""
+    with _WORDNET_LOCK:
+        return _get_wordnet_info(lemma, wn)
 
+
+def _prewarm_wordnet(lemmas: list[str], wn: Any) -> dict[str, dict[str, Any]]:
+    """Look up WordNet for all candidates serially (the corpus reader is not thread-safe)."""
+    return {lemma: _wordnet_info_cached(lemma, wn) for lemma in dict.fromkeys(lemmas)}
+
+
+def _suffix_variants(s: str) -> list[str]:
+    """Simple fallback morphology for one surface form."""
+    out: list[str] = []
+    if s.endswith("ies") and len(s) > 4:
+        out.append(s[:-3] + "y")
+    if s.endswith("es") and len(s) > 3:
+        out.append(s[:-2])
+    if s.endswith("s") and len(s) > 3:
+        out.append(s[:-1])
+    if s.endswith("ing") and len(s) > 5:
+        out.append(s[:-3])
+        out.append(s[:-3] + "e")
+    if s.endswith("ed") and len(s) > 4:
+        out.append(s[:-2])
+        out.append(s[:-1])
     return out
 
 
-def _lemma_candidates(word: str, lemma: str, wn: Any) -> list[str]:
-    """Build retry candidates to reduce dictionary-miss cases."""
+def _lemma_candidates(word: str, lemma: str, wn: Any, limit: int = 12) -> list[str]:
+    """Build retry candidates to reduce dictionary-miss cases (at most `limit`)."""
     seeds = [str(lemma or "").lower().strip(), str(word or "").lower().strip()]
     out: list[str] = []
     seen: set[str] = set()
 
-    def push(x: str) -> None:
+    def push(x: str) -> bool:
+        """Add a candidate; return False once the limit is reached."""
         t = x.strip().lower()
-        if not t or t in seen:
-            return
-        seen.add(t)
-        out.append(t)
+        if t and t not in seen:
+            seen.add(t)
+            out.append(t)
+        return len(out) < limit
 
     for s in seeds:
-        push(s)
+        if not push(s):
+            return out
 
-    # WordNet normalization candidates.
+    # WordNet normalization candidates (expanded from seeds only).
     if wn is not None:
-        for s in list(out):
+        for s in out[:]:
             for pos in ("n", "v", "a", "r"):
-                try:
-                    m = wn.morphy(s, pos=pos)
-                except Exception:  # noqa: BLE001
-                    m = None
-                if m:
-                    push(str(m))
-
-    # Simple fallback morphology.
-    for s in list(out):
-        if s.endswith("ies") and len(s) > 4:
-            push(s[:-3] + "y")
-        if s.endswith("es") and len(s) > 3:
-            push(s[:-2])
-        if s.endswith("s") and len(s) > 3:
-            push(s[:-1])
-        if s.endswith("ing") and len(s) > 5:
-            push(s[:-3])
-            push(s[:-3] + "e")
-        if s.endswith("ed") and len(s) > 4:
-            push(s[:-2])
-            push(s[:-1])
+                m = _morphy(s, pos, wn)
+                if m and not push(str(m)):
+                    return out
+
+    # Simple fallback morphology over seeds + WordNet forms.
+    for s in out[:]:
+        for v in _suffix_variants(s):
+            if not push(v):
+                return out
 
     return out
 
 
-def _get_pydictionary_info(lemma: str, pydict_cls: Any) -> dict[str, str]:
-    if pydict_cls is None:
-        return {"definition_en": ""}
-    try:
-        pyd = pydict_cls()
-        meaning = pyd.meaning(lemma)
-        if not meaning:
-            return {"definition_en": ""}
-        for pos_key in ("Noun", "Verb", "Adjective", "Adverb"):
-            defs = meaning.get(pos_key)
-            if defs:
-                return {"definition_en": str(defs[0])}
-    except Exception:  # noqa: BLE001
-        return {"definition_en": ""}
-    return {"definition_en": ""}
+def _get_http_session() -> requests.Session:
+    """Shared keep-alive session for dictionary lookups (pooled for parallel use)."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                session = requests.Session()
+                session.trust_env = False
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
 
 
-def _get_free_dict_info(
-    lemma: str,
-    api_cache: dict[str, dict[str, str]],
-    timeout_sec: int = 3,
-) -> dict[str, str]:
-    if lemma in api_cache:
-        return api_cache[lemma]
+def _empty_free_dict_info() -> dict[str, str]:
+    return {"phonetic": "", "definition_en": "", "example_en": ""}
+
 
-    data = {"phonetic": "", "definition_en": "", "example_en": ""}
-    url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{lemma}"
+def _fetch_free_dict_info(lemma: str, timeout_sec: int = 3) -> dict[str, str] | None:
+    """Query the API; None on transport/server errors (a 404 is a real, cacheable miss)."""
+    data = _empty_free_dict_info()
+    url = FREE_DICT_API_URL.format(lemma=lemma)
     try:
-        with requests.Session() as session:
-            session.trust_env = False
-            resp = session.get(url, timeout=timeout_sec)
+        resp = _get_http_session().get(url, timeout=timeout_sec)
+        if resp.status_code == 429 or resp.status_code >= 500:
+            return None
         if resp.ok:
             payload = resp.json()
             first = payload[0] if payload else {}
@@ -394,73 +488,185 @@ def _get_free_dict_info(
                     data["example_en"] = defs[0].get("example", "") or ""
     except Exception:  # noqa: BLE001
         # Silently ignore failures by design.
-        pass
-
-    api_cache[lemma] = data
-    time.sleep(0.2)
+        return None
     return data
 
 
+def _get_free_dict_info(
+    lemma: str,
+    api_cache: dict[str, dict[str, str]],
+    timeout_sec: int = 3,
+    store: DictCache | None = None,
+) -> dict[str, str]:
+    if lemma in api_cache:
+        return api_cache[lemma]
+    data = _fetch_free_dict_info(lemma, timeout_sec=timeout_sec)
+    if data is None:
+        data = _empty_free_dict_info()
+    elif store is not None:
+        store.set(lemma, data)
+    # setdefault keeps one shared entry if another worker raced on the same lemma.
+    return api_cache.setdefault(lemma, data)
+
+
+def _prefetch_free_dict_info(
+    lemmas: list[str],
+    api_cache: dict[str, dict[str, str]],
+    timeout_sec: int = 3,
+    store: DictCache | None = None,
+) -> None:
+    """Resolve uncached lemmas concurrently into `api_cache` (persisting successes to `store`)."""
+    pending = [x for x in dict.fromkeys(lemmas) if x and x not in api_cache]
+    if not pending:
+        return
+    fetched: dict[str, dict[str, str]] = {}
+    workers = min(FREE_DICT_MAX_WORKERS, len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for lemma, data in zip(pending, pool.map(lambda x: _fetch_free_dict_info(x, timeout_sec), pending)):
+            if data is None:
+                api_cache[lemma] = _empty_free_dict_info()
+            else:
+                api_cache[lemma] = fetched[lemma] = data
+    if store is not None:
+        store.set_many(fetched)
+
+
+def _resolve_dictionary_fields(
+    candidates: list[str],
+    wordnet_info: dict[str, dict[str, Any]],
+    api_cache: dict[str, dict[str, str]],
+    store: DictCache | None = None,
+) -> dict[str, Any]:
+    """Fill definition/example/translation/phonetic/derivatives from WordNet, then the API."""
+    found: dict[str, Any] = {
+        "definition_en": "",
+        "example_en": "",
+        "translation_ko": "",
+        "phonetic": "",
+        "derivatives": [],
+    }
+    for cand in candidates:
+        # 1) WordNet (resolved up front by _prewarm_wordnet; no corpus access from worker threads)
+        wn_info = wordnet_info[cand]
+        for key in ("definition_en", "example_en", "translation_ko"):
+            if not found[key]:
+                found[key] = wn_info[key]
+        if not found["derivatives"] and wn_info["derivatives"]:
+            found["derivatives"] = list(wn_info["derivatives"])
+
+        # 2) Free Dictionary API for phonetic/example/definition, only while one is missing
+        if not (found["definition_en"] and found["example_en"] and found["phonetic"]):
+            api_info = _get_free_dict_info(cand, api_cache=api_cache, timeout_sec=3, store=store)
+            for key in ("phonetic", "definition_en", "example_en"):
+                if not found[key]:
+                    found[key] = api_info.get(key, "") or ""
+
+        # Stop early when all major fields are resolved.
+        if found["definition_en"] and (found["example_en"] or found["phonetic"] or found["translation_ko"]):
+            break
+    return found
+
+
+@lru_cache(maxsize=1)
+def _get_nlp(spacy_mod: Any) -> Any:
+    """Load en_core_web_sm once per process; None when the model is unavailable."""
+    try:
+        # Only tagging/lemmatization and sentence bounds are used.
+        nlp = spacy_mod.load("en_core_web_sm", disable=["parser", "ner", "textcat"])
+    except Exception:  # noqa: BLE001
+        LOGGER.warning("spaCy model en_core_web_sm unavailable. Falling back to regex tokenization.")
+        return None
+    if "senter" in nlp.component_names:
+        nlp.enable_pipe("senter")
+    elif "sentencizer" not in nlp.pipe_names:
+        nlp.add_pipe("sentencizer")
+    return nlp
+
+
+@lru_cache(maxsize=1)
+def _get_stopwords(stopwords_mod: Any) -> frozenset[str]:
+    if stopwords_mod is None:
+        return frozenset()
+    try:
+        return frozenset(stopwords_mod.words("english"))
+    except Exception:  # noqa: BLE001
+        return frozenset()
+
+
 def _extract_candidates_spacy(
     script_text: str,
     min_word_length: int,
     spacy_mod: Any,
     stopwords_mod: Any,
-) -> list[dict[str, Any]]:
-    try:
-        nlp = spacy_mod.load("en_core_web_sm")
-    except Exception:  # noqa: BLE001
-        LOGGER.warning("spaCy model en_core_web_sm unavailable. Falling back to regex tokenization.")
-        return []
+) -> dict[str, dict[str, Any]]:
+    """Return {lemma: first-occurrence row}; rejected/duplicate tokens never allocate a row."""
+    nlp = _get_nlp(spacy_mod) if spacy_mod is not None else None
+    if nlp is None:
+        return {}
 
-    try:
-        stop_words = set(stopwords_mod.words("english")) if stopwords_mod else set()
-    except Exception:  # noqa: BLE001
-        stop_words = set()
+    from spacy.attrs import IS_ALPHA, IS_STOP, LEMMA, POS  # type: ignore
+    from spacy.symbols import PROPN  # type: ignore
 
+    stop_words = _get_stopwords(stopwords_mod)
     doc = nlp(script_text)
-    rows: list[dict[str, Any]] = []
-    for sent in doc.sents:
-        sent_text = sent.text.strip()
-        for tok in sent:
-            lemma = tok.lemma_.lower().strip()
-            if not tok.is_alpha:
-                continue
-            if tok.pos_ == "PROPN":
-                continue
-            if tok.is_stop or lemma in stop_words:
-                continue
-            if len(lemma) < min_word_length:
-                continue
-            rows.append(
-                {
-                    "word": tok.text,
-                    "lemma": lemma,
-                    "pos": tok.pos_,
-                    "context_sentence": sent_text,
-                }
-            )
+    # Export the filter columns in one call and mask them with array ops (spaCy ships numpy);
+    # only surviving token indices are visited from Python.
+    arr = doc.to_array([LEMMA, POS, IS_ALPHA, IS_STOP])
+    keep = ((arr[:, 2] == 1) & (arr[:, 3] == 0) & (arr[:, 1] != PROPN)).nonzero()[0]
+
+    strings = doc.vocab.strings
+    sents = list(doc.sents)
+    sent_idx = 0
+    rows: dict[str, dict[str, Any]] = {}
+    for i in keep.tolist():
+        lemma = strings[int(arr[i, 0])].lower().strip()
+        if len(lemma) < min_word_length or lemma in stop_words or lemma in rows:
+            continue
+        while sents[sent_idx].end <= i:
+            sent_idx += 1
+        tok = doc[i]
+        rows[lemma] = {
+            "word": tok.text,
+            "lemma": lemma,
+            "pos": tok.pos_,
+            "context_sentence": sents[sent_idx].text.strip(),
+        }
     return rows
 
 
-def _extract_candidates_regex(script_text: str, min_word_length: int) -> list[dict[str, Any]]:
-    sent_split = [s.strip() for s in re.split(r"(?<=[.!?])\s+", script_text) if s.strip()]
-    rows: list[dict[str, Any]] = []
-    token_re = re.compile(r"\b[a-zA-Z][a-zA-Z'-]+\b")
+def _split_sentences(text: str) -> list[str]:
+    """Split after ./!/? followed by whitespace, stripping and dropping empties in the same pass."""
+    out: list[str] = []
+    start = 0
+    for m in SENTENCE_END_RE.finditer(text):
+        sent = text[start : m.start() + 1].strip()
+        if sent:
+            out.append(sent)
+        start = m.end()
+    tail = text[start:].strip()
+    if tail:
+        out.append(tail)
+    return out
+
+
+def _extract_candidates_regex(script_text: str, min_word_length: int) -> dict[str, dict[str, Any]]:
+    """Return {lemma: first-occurrence row} from a plain regex tokenization."""
+    sent_split = _split_sentences(script_text)
+    rows: dict[str, dict[str, Any]] = {}
     for sent in sent_split:
-        for m in token_re.finditer(sent):
+        for m in TOKEN_RE.finditer(sent):
             word = m.group(0)
+            if len(word) < min_word_length:
+                continue
             lemma = word.lower()
-            if len(lemma) < min_word_length:
+            if lemma in rows:
                 continue
-            rows.append(
-                {
-                    "word": word,
-                    "lemma": lemma,
-                    "pos": "",
-                    "context_sentence": sent,
-                }
-            )
+            rows[lemma] = {
+                "word": word,
+                "lemma": lemma,
+                "pos": "",
+                "context_sentence": sent,
+            }
     return rows
 
 
@@ -470,7 +676,7 @@ def analyze_vocabulary(script_text: str, cfg: dict[str, Any]) -> list[dict[str,
     Rules:
     - Exclude stopwords, short tokens(<4 by default), non-alpha, PROPN.
     - Select candidates where frequency_score(-log10) >= 5.0.
-    - Dictionary resolution: WordNet -> PyDictionary -> Free Dictionary API.
+    - Dictionary resolution: WordNet -> Free Dictionary API -> blank.
     - Korean translation: OMW only, else empty string.
     """
 
@@ -481,66 +687,47 @@ def analyze_vocabulary(script_text: str, cfg: dict[str, Any]) -> list[dict[str,
     min_word_length = int(_cfg_get(cfg, "vocabulary.min_word_length", 4))
     top_n_words = int(_cfg_get(cfg, "vocabulary.top_n_words", 30))
 
-    candidates = _extract_candidates_spacy(
+    by_lemma = _extract_candidates_spacy(
         script_text=script_text,
         min_word_length=min_word_length,
         spacy_mod=deps["spacy"],
         stopwords_mod=deps["stopwords"],
     )
-    if not candidates:
-        candidates = _extract_candidates_regex(script_text=script_text, min_word_length=min_word_length)
+    if not by_lemma:
+        by_lemma = _extract_candidates_regex(script_text=script_text, min_word_length=min_word_length)
 
-    by_lemma: dict[str, dict[str, Any]] = {}
-    for c in candidates:
-        lemma = c["lemma"]
-        if lemma not in by_lemma:
-            by_lemma[lemma] = c
-
-    api_cache: dict[str, dict[str, str]] = {}
-    results: list[dict[str, Any]] = []
+    # Tag B2+ lemmas in one bulk set intersection instead of a lookup per result row.
+    b2_hits = B2_PLUS_NEWS_WORDS.intersection(by_lemma)
 
+    common = _common_words(deps["top_n_list"], deps["word_frequency"])
+    scored: list[tuple[str, dict[str, Any], float, list[str]]] = []
     for lemma, base in by_lemma.items():
+        if lemma in common:
+            continue
         score = _frequency_score(lemma, deps["word_frequency"])
-        if score < 5.0:
+        if score < RARE_SCORE_THRESHOLD:
             continue
+        scored.append((lemma, base, score, _lemma_candidates(base.get("word", ""), lemma, deps["wn"])))
+
+    # The API is always queried for each lemma's first candidate; fetch those in parallel up front.
+    # Further candidates are only looked up on demand when the first one leaves fields empty.
+    # Persistent lemma cache (SQLite under paths.cache_dir) answers repeat lookups without HTTP.
+    store = get_dict_cache(dict_cache_path(_cfg_get(cfg, "paths.cache_dir", None)))
+    api_cache: dict[str, dict[str, str]] = {}
+    if store is not None:
+        api_cache.update(store.get_many([x for _, _, _, c in scored for x in c]))
+    _prefetch_free_dict_info([c[0] for _, _, _, c in scored if c], api_cache, timeout_sec=3, store=store)
+    wordnet_info = _prewarm_wordnet([x for _, _, _, c in scored for x in c], deps["wn"])
+    results: list[dict[str, Any]] = []
 
-        definition_en = ""
-        example_en = ""
-        translation_ko = ""
-        derivatives: list[str] = []
-        phonetic = ""
-
-        candidates = _lemma_candidates(base.get("word", ""), lemma, deps["wn"])
-        for cand in candidates:
-            # 1) WordNet
-            wn_info = _get_wordnet_info(cand, deps["wn"])
-            if not definition_en:
-                definition_en = wn_info["definition_en"]
-            if not example_en:
-                example_en = wn_info["example_en"]
-            if not translation_ko:
-                translation_ko = wn_info["translation_ko"]
-            if not derivatives and wn_info["derivatives"]:
-                derivatives = wn_info["derivatives"]
-
-            # 2) PyDictionary fallback for definition
-            if not definition_en:
-                py_info = _get_pydictionary_info(cand, deps["PyDictionary"])
-                definition_en = py_info.get("definition_en", "") or definition_en
-
-            # 3) Free Dictionary API for phonetic/example/definition
-            api_info = _get_free_dict_info(cand, api_cache=api_cache, timeout_sec=3)
-            if not phonetic:
-                phonetic = api_info.get("phonetic", "") or ""
-            if not definition_en:
-                definition_en = api_info.get("definition_en", "") or ""
-            if not example_en:
-                example_en = api_info.get("example_en", "") or ""
-
-            # Stop early when all major fields are resolved.
-            if definition_en and (example_en or phonetic or translation_ko):
-                break
+    # Only the occasional on-demand API call is left per lemma; overlap those.
+    workers = max(1, min(FREE_DICT_MAX_WORKERS, len(scored)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        resolved = list(
+            pool.map(lambda item: _resolve_dictionary_fields(item[3], wordnet_info, api_cache, store), scored)
+        )
 
+    for (lemma, base, score, _), found in zip(scored, resolved):
         pos = base.get("pos", "") or ""
         pos_ko = POS_KO_MAP.get(pos, "")
         row = {
@@ -548,15 +735,15 @@ def analyze_vocabulary(script_text: str, cfg: dict[str, Any]) -> list[dict[str,
             "lemma": lemma,
             "pos": pos,
             "pos_ko": pos_ko,
-            "phonetic": phonetic,
-            "definition_en": definition_en,
-            "translation_ko": translation_ko,
-            "example_en": example_en,
+            "phonetic": found["phonetic"],
+            "definition_en": found["definition_en"],
+            "translation_ko": found["translation_ko"],
+            "example_en": found["example_en"],
             "context_sentence": base.get("context_sentence", ""),
             "cefr_level": _estimate_cefr(score),
             "frequency_score": round(score, 4),
-            "is_b2_plus": lemma in B2_PLUS_NEWS_WORDS,
-            "derivatives": derivatives,
+            "is_b2_plus": lemma in b2_hits,
+            "derivatives": found["derivatives"],
         }
         results.append(row)
 
@@ -573,7 +760,8 @@ def save_vocabulary(vocab_data: list[dict[str, Any]], date_str: str, cfg: dict[s
     """
 
     logs_dir = Path(_cfg_get(cfg, "paths.logs_dir", "logs"))
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    if not _cfg_get(cfg, "dirs_ready", False):
+        logs_dir.mkdir(parents=True, exist_ok=True)
 
     json_path = logs_dir / f"vocabulary_{date_str}.json"
     csv_path = logs_dir / f"vocabulary_{date_str}.csv"
@@ -583,7 +771,13 @@ def save_vocabulary(vocab_data: list[dict[str, Any]], date_str: str, cfg: dict[s
         "count": len(vocab_data),
         "items": vocab_data,
     }
-    json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        # Stream encoder chunks instead of building the whole document in memory.
+        with json_path.open("w", encoding="utf-8") as f:
+            for chunk in json.JSONEncoder(ensure_ascii=False, indent=2).iterencode(payload):
+                f.write(chunk)
 
     fieldnames = [
         "word",
@@ -600,13 +794,13 @@ def save_vocabulary(vocab_data: list[dict[str, Any]], date_str: str, cfg: dict[s
         "is_b2_plus",
         "derivatives",
     ]
+    scalar_fields = fieldnames[:-1]  # derivatives is joined separately
     with csv_path.open("w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for item in vocab_data:
-            row = dict(item)
-            row["derivatives"] = "|".join(item.get("derivatives", []))
-            writer.writerow(row)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            [*(item.get(k, "") for k in scalar_fields), "|".join(item.get("derivatives", []))] for item in vocab_data
+        )
 
     LOGGER.info("Saved vocabulary json=%s csv=%s count=%d", json_path, csv_path, len(vocab_data))
     return str(json_path), str(csv_path)
@@ -7,22 +7,44 @@ https://www.arirang.com/radio/132/podcast/668?lang=en
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+import atexit
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import html
+from itertools import accumulate
 import json
 import logging
+import os
 from pathlib import Path
 import re
+import shutil
+import threading
 import time
-from typing import Any
+from typing import Any, Iterator, Mapping
 from urllib.parse import urljoin
 from urllib.parse import parse_qs, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError  # type: ignore
+    from playwright.async_api import async_playwright  # type: ignore
+except ImportError:
+    PlaywrightTimeoutError = TimeoutError
+    async_playwright = None
+
 
 LOGGER = logging.getLogger(__name__)
+_SEOUL_TZ = ZoneInfo("Asia/Seoul")
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -32,27 +54,212 @@ DEFAULT_HEADERS = {
     )
 }
 
-TIME_PATTERNS = [
-    re.compile(r"\b(21[:.]55)\b", re.IGNORECASE),
-    re.compile(r"\b(10\s*PM)\b", re.IGNORECASE),
-    re.compile(r"\b(2155)\b", re.IGNORECASE),
-]
-DATE_PATTERNS = [
-    re.compile(r"\b(20\d{2})[-./](\d{2})[-./](\d{2})\b"),
-    re.compile(r"\b(20\d{2})(\d{2})(\d{2})\b"),
-]
+# Target timeslot tokens (21:55 / 10 PM / 2155) as one alternation.
+TIME_PATTERN = re.compile(r"\b(?:21[:.]55|10\s*PM|2155)\b", re.IGNORECASE)
+SEPARATED_DATE_PATTERN = re.compile(r"\b(20\d{2})[-./](\d{2})[-./](\d{2})\b")
+# Separated (YYYY-MM-DD) or compact (YYYYMMDD) date in one scan.
+DATE_UNION_PATTERN = re.compile(r"\b(?:(20\d{2})[-./](\d{2})[-./](\d{2})|(20\d{2})(\d{2})(\d{2}))\b")
 HHMM_PATTERN = re.compile(r"\b([01]?\d|2[0-3])[:.]([0-5]\d)\b")
+PM10_PATTERN = re.compile(r"\b10\s*PM\b", re.IGNORECASE)
+NUM2155_PATTERN = re.compile(r"\b2155\b")
+DATE8_PATTERN = re.compile(r"\d{8}")
+NON_DIGIT_PATTERN = re.compile(r"[^0-9]")
+KOLLUS_MEDIA_URL_PATTERNS = (
+    re.compile(r'"media_url"\s*:\s*"([^"]+)"', re.IGNORECASE),
+    re.compile(r"'media_url'\s*:\s*'([^']+)'", re.IGNORECASE),
+    re.compile(r"https?://[^\"'\\s]+\\.(?:mp3|mp4)(?:\\?[^\"'\\s]*)?", re.IGNORECASE),
+)
+UPLOAD_FILE_KEY_PATTERN = re.compile(r'"upload_file_key"\s*:\s*"([^"]+)"', re.IGNORECASE)
+YEAR_DATE8_PATTERN = re.compile(r"(20\d{6})")
+ARIRANG_PATH_DATE_PATTERN = re.compile(r"/arirang/(20\d{6})/")
+# Path (before "?") ends in .mp3/.mp4/.m4a and has no ".smil"; case-insensitive, no lowered copy.
+AUDIO_URL_PATTERN = re.compile(r"(?![^?]*\.smil)[^?]*\.(?:mp3|mp4|m4a)(?:\?|\Z)", re.IGNORECASE)
+# Intercepted JSON responses worth keeping (URL mentions the podcast API).
+RESP_JSON_URL_PATTERN = re.compile(r"api|podcast|668|episode", re.IGNORECASE)
+# Same test as a case-insensitive ".mp3"/".mp4" substring check, without a lowered copy.
+MEDIA_EXT_PATTERN = re.compile(r"\.mp[34]", re.IGNORECASE)
+M3U8_PATH_PATTERN = re.compile(r"/arirang/(20\d{6})/(\d+)/hls/([^/]+)/index\.m3u8", re.IGNORECASE)
+MEDIA_DATE_PATTERNS = (
+    ARIRANG_PATH_DATE_PATTERN,
+    re.compile(r"_(20\d{6})-"),
+    re.compile(r"\b(20\d{6})\b"),
+)
+# Script sanitizer passes (applied in this order).
+DATA_ATTR_PATTERN = re.compile(
+    r"\bdata\s*-\s*[a-z-]+\s*=\s*(?:'[^']*'|\"[^\"]*\"|[^\s>]+)\s*(?:>|&gt;|&amp;gt;)?",
+    re.IGNORECASE,
+)
+BR_TAG_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+MARK_TAG_PATTERN = re.compile(r"</?mark[^>]*>", re.IGNORECASE)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+INLINE_WS_PATTERN = re.compile(r"[ \t]+")
+MULTI_NEWLINE_PATTERN = re.compile(r"\n{3,}")
+EPISODE_MARKER_PATTERN = re.compile(
+    r"""
+    (?P<id>\d{4})\s+
+    (?P<date>\d{4}-\d{2}-\d{2})\s+
+    Podcast\s+Play\s+
+    (?P<time>\d{1,2}:\d{2})\s+
+    Arirang\s+News
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+# API item title tokens used for scoring; match.lastgroup names the kind.
+TITLE_SLOT_PATTERN = re.compile(r"(?P<hhmm>21:55|2155)|(?P<pm>10 PM)|(?P<news>NEWS)", re.IGNORECASE)
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+PAGE_READY_SELECTOR = "iframe[src*='kollus'], .playList-wrap li"
+PODCAST_LIST_SELECTOR = "li, article, .item, .list-item, .podcast-item, [class*='podcast'], [class*='episode']"
+PODCAST_CLICKABLE_SELECTOR = "a, button, [role='button']"
+PODCAST_TIME_TOKENS_UPPER = [tok.upper() for tok in ("21:55", "2155", "10 PM", "10PM", "9:55 PM", "21.55")]
+# First candidate with date+time wins; otherwise the longest date-only candidate.
+# Each token class is folded into one case-insensitive alternation, so a node is scanned once per class.
+PODCAST_LIST_PICK_JS = r"""
+({ selector, clickable, dateTokens, timeTokens }) => {
+  const union = (toks) => new RegExp(toks.map((t) => t.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'), 'i');
+  const dateRe = union(dateTokens), timeRe = union(timeTokens);
+  const nodes = document.querySelectorAll(selector);
+  let best = -1, bestLen = -1;
+  for (let i = 0; i < nodes.length; i++) {
+    const text = (nodes[i].innerText || '').split(/\s+/).filter(Boolean).join(' ');
+    if (!dateRe.test(text)) continue;
+    if (timeRe.test(text)) {
+      return { index: i, hasClickable: !!nodes[i].querySelector(clickable) };
+    }
+    if (text.length > bestLen) { bestLen = text.length; best = i; }
+  }
+  if (best < 0) return { index: -1, hasClickable: false };
+  return { index: best, hasClickable: !!nodes[best].querySelector(clickable) };
+}
+"""
+
+EPISODE_ROW_SELECTOR = ".playList-wrap li, .info_episodeList_playList li, li.list"
+INNER_TEXTS_JS = "(sel) => Array.from(document.querySelectorAll(sel), (el) => el.innerText || '')"
+# Mirrors _pick_longest_text per selector: normalize whitespace, first longest wins.
+# One union query walks the DOM once, and each element's innerText (a layout read) is taken at most once.
+LONGEST_TEXT_PER_SELECTOR_JS = r"""
+(selectors) => {
+  const best = selectors.map(() => '');
+  document.querySelectorAll(selectors.join(', ')).forEach((el) => {
+    let t = null;
+    selectors.forEach((sel, i) => {
+      if (!el.matches(sel)) return;
+      if (t === null) t = (el.innerText || '').split(/\s+/).filter(Boolean).join(' ');
+      if (t.length > best[i].length) best[i] = t;
+    });
+  });
+  return best;
+}
+"""
+
+# Serializes read-modify-write of download_log.json when dates are crawled concurrently.
+_DOWNLOAD_LOG_LOCK = threading.Lock()
+# str(path) -> (mtime_ns, size, parsed log); skips re-parsing an unchanged download_log.json.
+_DOWNLOAD_LOG_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+# One event loop + Chromium shared by every list/detail fetch in the process.
+_ASYNC_LOOP: asyncio.AbstractEventLoop | None = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+_BROWSER_LOCK = asyncio.Lock()
+_PLAYWRIGHT: Any = None
+_BROWSER: Any = None
+
+
+def _jloads(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _jdumps(obj: Any) -> bytes:
+    """Serialize as indented UTF-8 JSON bytes (same layout as json.dumps(indent=2))."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def _cfg_get(cfg: dict[str, Any], path: str, default: Any) -> Any:
     cur: Any = cfg
     for key in path.split("."):
-        if not isinstance(cur, dict) or key not in cur:
+        if not isinstance(cur, Mapping) or key not in cur:
             return default
         cur = cur[key]
     return cur
 
 
+@dataclass(frozen=True)
+class CrawlConfig:
+    """Crawler settings resolved once from the nested config dict."""
+
+    retry_count: int
+    retry_delay: float
+    timeout: float
+    api_base_url: str
+    target_url: str
+    kollus_fallback_url: str
+    media_retry_count: int
+    media_retry_delay: float
+    download_path: Path
+    logs_dir: Path
+    dirs_ready: bool
+    page_wait_until: str
+    nav_timeout_ms: float
+
+    @classmethod
+    def from_dict(cls, cfg: Mapping[str, Any]) -> CrawlConfig:
+        return cls(
+            retry_count=int(_cfg_get(cfg, "crawl.retry_count", _cfg_get(cfg, "retry_count", 3))),
+            retry_delay=float(_cfg_get(cfg, "crawl.retry_delay", _cfg_get(cfg, "retry_delay", 1.5))),
+            timeout=float(_cfg_get(cfg, "crawl.timeout_sec", 20)),
+            api_base_url=str(_cfg_get(cfg, "crawl.api_base_url", "https://www.arirang.com")).rstrip("/"),
+            target_url=str(_cfg_get(cfg, "crawl.target_url", "https://www.arirang.com/radio/132/podcast/668?lang=en")),
+            kollus_fallback_url=str(
+                _cfg_get(cfg, "crawl.kollus_fallback_url", "https://v.kr.kollus.com/lstBUSaP?cdn=arirang-dd")
+            ),
+            media_retry_count=int(_cfg_get(cfg, "crawl.media_retry_count", 5)),
+            media_retry_delay=float(_cfg_get(cfg, "crawl.media_retry_delay", 2.0)),
+            download_path=Path(_cfg_get(cfg, "crawl.download_path", "./downloads")),
+            logs_dir=Path(_cfg_get(cfg, "paths.logs_dir", "logs")),
+            dirs_ready=bool(_cfg_get(cfg, "dirs_ready", False)),
+            page_wait_until=str(_cfg_get(cfg, "crawl.page_wait_until", "domcontentloaded")),
+            nav_timeout_ms=float(_cfg_get(cfg, "crawl.nav_timeout_ms", 8000)),
+        )
+
+
+# (cfg object, resolved view); the pipeline passes one cfg dict through every call.
+_CRAWL_CONFIG_CACHE: tuple[Any, CrawlConfig] | None = None
+
+
+def _crawl_config(cfg: Mapping[str, Any]) -> CrawlConfig:
+    global _CRAWL_CONFIG_CACHE
+    cached = _CRAWL_CONFIG_CACHE
+    if cached is not None and cached[0] is cfg:
+        return cached[1]
+    resolved = CrawlConfig.from_dict(cfg)
+    _CRAWL_CONFIG_CACHE = (cfg, resolved)
+    return resolved
+
+
+def _get_session() -> requests.Session:
+    """Return the shared keep-alive session used by every crawler HTTP call."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.trust_env = False
+                # Session-level defaults: requests merges these per call without a dict copy here.
+                session.headers.update(DEFAULT_HEADERS)
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
 def _request_with_retry(
     session: requests.Session,
     method: str,
@@ -60,13 +267,9 @@ def _request_with_retry(
     cfg: dict[str, Any],
     **kwargs: Any,
 ) -> requests.Response:
-    retry_count = int(_cfg_get(cfg, "crawl.retry_count", _cfg_get(cfg, "retry_count", 3)))
-    retry_delay = float(_cfg_get(cfg, "crawl.retry_delay", _cfg_get(cfg, "retry_delay", 1.5)))
-    timeout = float(_cfg_get(cfg, "crawl.timeout_sec", 20))
+    ccfg = _crawl_config(cfg)
+    retry_count, retry_delay, timeout = ccfg.retry_count, ccfg.retry_delay, ccfg.timeout
 
-    headers = dict(DEFAULT_HEADERS)
-    headers.update(kwargs.pop("headers", {}))
-    kwargs["headers"] = headers
     kwargs["timeout"] = kwargs.get("timeout", timeout)
 
     last_exc: Exception | None = None
@@ -79,9 +282,7 @@ def _request_with_retry(
             last_exc = exc
             LOGGER.warning("Request failed (%s/%s): %s", attempt, retry_count, url)
             if attempt < retry_count:
-                from time import sleep
-
-                sleep(retry_delay)
+                time.sleep(retry_delay)
     raise RuntimeError(f"Request failed after retries: {url}") from last_exc
 
 
@@ -91,16 +292,17 @@ def _api_post_json(
     payload: dict[str, Any],
     cfg: dict[str, Any],
 ) -> dict[str, Any]:
-    base = str(_cfg_get(cfg, "crawl.api_base_url", "https://www.arirang.com")).rstrip("/")
+    ccfg = _crawl_config(cfg)
+    base = ccfg.api_base_url
     url = f"{base}{path}"
     headers = {
         "Accept": "application/json, text/plain, */*",
         "Content-Type": "application/json",
         "Origin": base,
-        "Referer": str(_cfg_get(cfg, "crawl.target_url", "https://www.arirang.com/radio/132/podcast/668?lang=en")),
+        "Referer": ccfg.target_url,
     }
     resp = _request_with_retry(session, "POST", url, cfg, json=payload, headers=headers)
-    data = resp.json()
+    data = _jloads(resp.content)
     if not isinstance(data, dict):
         return {}
     return data
@@ -108,21 +310,25 @@ def _api_post_json(
 
 def _extract_date_yyyymmdd(text: str) -> str:
     s = text or ""
-    for pat in DATE_PATTERNS:
-        m = pat.search(s)
-        if m:
-            yyyy, mm, dd = m.group(1), m.group(2), m.group(3)
-            return f"{yyyy}{mm}{dd}"
-    return ""
+    m = DATE_UNION_PATTERN.search(s)
+    if not m:
+        return ""
+    if m.group(1):
+        return f"{m.group(1)}{m.group(2)}{m.group(3)}"
+    # A separated date anywhere still wins over an earlier compact one.
+    sep = SEPARATED_DATE_PATTERN.search(s, m.end())
+    if sep:
+        return f"{sep.group(1)}{sep.group(2)}{sep.group(3)}"
+    return f"{m.group(4)}{m.group(5)}{m.group(6)}"
 
 
 def _extract_airtime(text: str) -> str:
     m = HHMM_PATTERN.search(text or "")
     if m:
         return f"{int(m.group(1)):02d}:{int(m.group(2)):02d}"
-    if re.search(r"\b10\s*PM\b", text or "", re.IGNORECASE):
+    if PM10_PATTERN.search(text or ""):
         return "22:00"
-    if re.search(r"\b2155\b", text or ""):
+    if NUM2155_PATTERN.search(text or ""):
         return "21:55"
     return ""
 
@@ -141,15 +347,13 @@ def _select_target_episode(episodes: list[dict[str, Any]]) -> dict[str, Any] | N
             return chosen
         return None
 
-    def has_target_time(ep: dict[str, Any]) -> bool:
-        title = ep.get("title", "") or ""
-        airtime = ep.get("airtime", "") or ""
-        haystack = f"{title} {airtime}"
-        return any(p.search(haystack) for p in TIME_PATTERNS)
-
-    preferred = [e for e in d1 if has_target_time(e)]
-    if preferred:
-        chosen = preferred[0]
+    # One scan over every candidate's title/airtime. NUL separators keep a token from spanning
+    # two fields, and the first hit's offset maps back to the first matching episode.
+    fields = [str(f or "") for e in d1 for f in (e.get("title", ""), e.get("airtime", ""))]
+    starts = list(accumulate((len(f) + 1 for f in fields), initial=0))
+    m = TIME_PATTERN.search("\x00".join(fields))
+    if m:
+        chosen = d1[(bisect_right(starts, m.start()) - 1) // 2]
         LOGGER.info(
             "Episode selection rule: matched D-1 and target timeslot token (21:55/10 PM/2155). "
             "selected=%s",
@@ -157,7 +361,7 @@ def _select_target_episode(episodes: list[dict[str, Any]]) -> dict[str, Any] | N
         )
         return chosen
 
-    chosen = sorted(d1, key=lambda x: x.get("airtime", ""), reverse=True)[0]
+    chosen = max(d1, key=lambda x: x.get("airtime", ""))
     LOGGER.info(
         "Episode selection rule: no target timeslot token on D-1; selected latest D-1 episode. "
         "selected=%s airtime=%s",
@@ -167,18 +371,94 @@ def _select_target_episode(episodes: list[dict[str, Any]]) -> dict[str, Any] | N
     return chosen
 
 
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """Return the crawler's long-lived event loop, started on a daemon thread."""
+    global _ASYNC_LOOP
+    if _ASYNC_LOOP is None:
+        with _ASYNC_LOOP_LOCK:
+            if _ASYNC_LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="crawler-async", daemon=True).start()
+                _ASYNC_LOOP = loop
+    return _ASYNC_LOOP
+
+
+def _run_async(coro: Any, timeout: float | None = None) -> Any:
+    """Run a coroutine on the shared loop so Playwright objects outlive a single call."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result(timeout)
+
+
+async def _get_browser() -> Any:
+    """Launch Chromium once per process; later calls reuse the running browser."""
+    global _PLAYWRIGHT, _BROWSER
+    async with _BROWSER_LOCK:
+        if _BROWSER is None or not _BROWSER.is_connected():
+            if async_playwright is None:
+                raise RuntimeError("Playwright is required. Install: pip install playwright")
+            if _PLAYWRIGHT is None:
+                _PLAYWRIGHT = await async_playwright().start()
+            _BROWSER = await _PLAYWRIGHT.chromium.launch(headless=True)
+    return _BROWSER
+
+
+async def _close_browser() -> None:
+    global _PLAYWRIGHT, _BROWSER
+    async with _BROWSER_LOCK:
+        if _BROWSER is not None:
+            await _BROWSER.close()
+            _BROWSER = None
+        if _PLAYWRIGHT is not None:
+            await _PLAYWRIGHT.stop()
+            _PLAYWRIGHT = None
+
+
+def shutdown_browser() -> None:
+    """Close the shared Playwright browser, if one was started."""
+    if _ASYNC_LOOP is None or _BROWSER is None and _PLAYWRIGHT is None:
+        return
+    try:
+        _run_async(_close_browser(), timeout=30)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("Failed to close Playwright browser: %s", exc)
+
+
+atexit.register(shutdown_browser)
+
+
 def _ensure_download_log(path: Path) -> dict[str, Any]:
-    if path.exists():
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:  # noqa: BLE001
-            return {}
-    return {}
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    cached = _DOWNLOAD_LOG_CACHE.get(str(path))
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        # Shallow copy: callers add keys before writing back.
+        return dict(cached[2])
+    try:
+        payload = _jloads(path.read_bytes())
+    except Exception:  # noqa: BLE001
+        return {}
+    if isinstance(payload, dict):
+        _DOWNLOAD_LOG_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, payload)
+        return dict(payload)
+    return payload
 
 
 def _write_download_log(path: Path, payload: dict[str, Any]) -> None:
+    # Write-then-rename: a crash mid-write must not leave truncated JSON that reads back as {}.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(_jdumps(payload))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try:
+        st = path.stat()
+    except OSError:
+        _DOWNLOAD_LOG_CACHE.pop(str(path), None)
+    else:
+        _DOWNLOAD_LOG_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, dict(payload))
 
 
 def _get_target_date() -> tuple[str, str]:
@@ -190,15 +470,19 @@ def _get_target_date() -> tuple[str, str]:
             - display date: YYYY-MM-DD
     """
 
-    now = datetime.now(ZoneInfo("Asia/Seoul"))
-    target = now.date() - timedelta(days=1)
+    return _target_date_for(datetime.now(_SEOUL_TZ).date())
+
+
+@lru_cache(maxsize=1)
+def _target_date_for(today: date) -> tuple[str, str]:
+    target = today - timedelta(days=1)
     return target.strftime("%Y%m%d"), target.strftime("%Y-%m-%d")
 
 
 async def _async_fetch_episode_list(cfg: dict[str, Any]) -> list[dict[str, Any]]:
     """Fetch episode list seed from the exact podcast page URL."""
 
-    target_url = _cfg_get(cfg, "crawl.target_url", "https://www.arirang.com/radio/132/podcast/668?lang=en")
+    target_url = _crawl_config(cfg).target_url
     date_compact, _ = _get_target_date()
     return [
         {
@@ -232,7 +516,7 @@ def fetch_episode_list(cfg: dict[str, Any]) -> list[dict[str, Any]]:
         LOGGER.warning("Arirang API list path failed; fallback to legacy path: %s", exc)
 
     try:
-        episodes = asyncio.run(_async_fetch_episode_list(cfg))
+        episodes = _run_async(_async_fetch_episode_list(cfg))
     except Exception as exc:  # noqa: BLE001
         LOGGER.warning("Playwright list crawl failed, using Kollus fallback: %s", exc)
         kollus_url, media_url, inferred = _resolve_kollus_media(cfg)
@@ -260,41 +544,39 @@ def fetch_episode_list(cfg: dict[str, Any]) -> list[dict[str, Any]]:
 
 
 def _pick_longest_text(items: list[str]) -> str:
-    cleaned = [" ".join((x or "").split()) for x in items]
-    cleaned = [x for x in cleaned if x]
-    if not cleaned:
-        return ""
-    return sorted(cleaned, key=len, reverse=True)[0]
+    # Single pass; strict ">" keeps the first of equally long texts.
+    best = ""
+    for x in items:
+        if not x:
+            continue
+        cleaned = " ".join(x.split())
+        if len(cleaned) > len(best):
+            best = cleaned
+    return best
 
 
-def _iter_nested_strings(obj: Any) -> list[str]:
-    out: list[str] = []
-    if isinstance(obj, str):
-        out.append(obj)
-    elif isinstance(obj, dict):
-        for v in obj.values():
-            out.extend(_iter_nested_strings(v))
-    elif isinstance(obj, list):
-        for v in obj:
-            out.extend(_iter_nested_strings(v))
-    return out
+def _iter_nested_strings(obj: Any) -> Iterator[str]:
+    # Explicit stack; children are pushed reversed so strings come out in document order.
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, str):
+            yield cur
+        elif isinstance(cur, dict):
+            stack.extend(reversed(cur.values()))
+        elif isinstance(cur, list):
+            stack.extend(reversed(cur))
 
 
 def _extract_urls_from_obj(obj: Any) -> list[str]:
-    urls: list[str] = []
-    for s in _iter_nested_strings(obj):
-        if ".mp3" in s.lower() or ".mp4" in s.lower():
-            urls.append(s)
-    return urls
+    search = MEDIA_EXT_PATTERN.search
+    return [s for s in _iter_nested_strings(obj) if search(s)]
 
 
 def _is_downloadable_audio_url(url: str) -> bool:
     if not url:
         return False
-    u = url.lower().split("?", 1)[0]
-    if u.endswith(".m3u8") or ".smil" in u:
-        return False
-    return u.endswith(".mp3") or u.endswith(".mp4") or u.endswith(".m4a")
+    return AUDIO_URL_PATTERN.match(url) is not None
 
 
 def _derive_direct_mp4_from_m3u8(url: str) -> str:
@@ -305,11 +587,7 @@ def _derive_direct_mp4_from_m3u8(url: str) -> str:
         parsed = urlsplit(url)
         q = parse_qs(parsed.query)
         hdnts = q.get("hdnts", [""])[0]
-        m = re.search(
-            r"/arirang/(20\d{6})/(\d+)/hls/([^/]+)/index\.m3u8",
-            parsed.path,
-            re.IGNORECASE,
-        )
+        m = M3U8_PATH_PATTERN.search(parsed.path)
         if not m or not hdnts:
             return ""
         date_key, media_id, filename = m.group(1), m.group(2), m.group(3)
@@ -326,8 +604,8 @@ def _extract_media_date_yyyymmdd(url: str) -> str:
     if not url:
         return ""
     s = html.unescape(str(url))
-    for pat in (r"/arirang/(20\d{6})/", r"_(20\d{6})-", r"\b(20\d{6})\b"):
-        m = re.search(pat, s)
+    for pat in MEDIA_DATE_PATTERNS:
+        m = pat.search(s)
         if m:
             return m.group(1)
     return ""
@@ -375,18 +653,13 @@ def _sanitize_script_source(text: str) -> str:
     if not raw.strip():
         return ""
     # Remove leaked inline attributes such as data-lemma='word'>.
-    raw = re.sub(
-        r"\bdata\s*-\s*[a-z-]+\s*=\s*(?:'[^']*'|\"[^\"]*\"|[^\s>]+)\s*(?:>|&gt;|&amp;gt;)?",
-        "",
-        raw,
-        flags=re.IGNORECASE,
-    )
+    raw = DATA_ATTR_PATTERN.sub("", raw)
     # Remove common html tags from rich-text payload.
-    raw = re.sub(r"<br\s*/?>", "\n", raw, flags=re.IGNORECASE)
-    raw = re.sub(r"</?mark[^>]*>", "", raw, flags=re.IGNORECASE)
-    raw = re.sub(r"<[^>]+>", "", raw)
-    raw = re.sub(r"[ \t]+", " ", raw)
-    raw = re.sub(r"\n{3,}", "\n\n", raw)
+    raw = BR_TAG_PATTERN.sub("\n", raw)
+    raw = MARK_TAG_PATTERN.sub("", raw)
+    raw = HTML_TAG_PATTERN.sub("", raw)
+    raw = INLINE_WS_PATTERN.sub(" ", raw)
+    raw = MULTI_NEWLINE_PATTERN.sub("\n\n", raw)
     return raw.strip()
 
 
@@ -397,12 +670,7 @@ def _slice_script_by_episode_marker(script_text: str, target_date_yyyymmdd: str,
         return ""
 
     date_iso = f"{target_date_yyyymmdd[:4]}-{target_date_yyyymmdd[4:6]}-{target_date_yyyymmdd[6:8]}"
-    marker_pat = re.compile(
-        r"(?P<id>\d{4})\s+(?P<date>\d{4}-\d{2}-\d{2})\s+Podcast\s+Play\s+(?P<time>\d{1,2}:\d{2})\s+Arirang\s+News",
-        re.IGNORECASE,
-    )
-
-    matches = list(marker_pat.finditer(raw))
+    matches = list(EPISODE_MARKER_PATTERN.finditer(raw))
     if not matches:
         return raw.strip()
 
@@ -422,13 +690,18 @@ def _slice_script_by_episode_marker(script_text: str, target_date_yyyymmdd: str,
     return sliced or raw.strip()
 
 
+def _title_slot_kinds(title: str) -> set[str]:
+    """Token kinds ("hhmm", "pm", "news") present in an API item title, from one scan."""
+    return {m.lastgroup for m in TITLE_SLOT_PATTERN.finditer(title)}
+
+
 def _extract_script_and_media_from_api_cache(
     api_json_cache: list[dict[str, Any]],
     target_date_yyyymmdd: str,
 ) -> tuple[str, str]:
     """Extract best-effort script and media URL from intercepted API JSON."""
     target_date = f"{target_date_yyyymmdd[:4]}-{target_date_yyyymmdd[4:6]}-{target_date_yyyymmdd[6:8]}"
-    candidates: list[tuple[int, str, str]] = []  # (score, script, media_url)
+    best: tuple[int, str, str] = (0, "", "")  # (score, script, media_url); first of equal scores wins
 
     for data in api_json_cache:
         items = data.get("item")
@@ -438,7 +711,7 @@ def _extract_script_and_media_from_api_cache(
             if not isinstance(item, dict):
                 continue
             bdate = str(item.get("broadcast_date", ""))
-            title = str(item.get("title", ""))
+            kinds = _title_slot_kinds(str(item.get("title", "")))
             content = str(item.get("content", "") or "")
             media_info = item.get("media_info", {})
             media_url = ""
@@ -451,24 +724,28 @@ def _extract_script_and_media_from_api_cache(
             score = 0
             if target_date in bdate:
                 score += 5
-            if "21:55" in title or "2155" in title:
+            if "hhmm" in kinds:
                 score += 4
-            if "10 PM" in title.upper():
+            if "pm" in kinds:
                 score += 3
             if content.strip():
                 score += 2
             if media_url:
                 score += 1
-            if score > 0:
-                candidates.append((score, content.strip(), media_url.strip()))
+            if score > best[0]:
+                best = (score, content.strip(), media_url.strip())
 
-    if not candidates:
-        return "", ""
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    best = candidates[0]
     return best[1], best[2]
 
 
+async def _longest_text_per_selector(page: Any, selectors: list[str]) -> list[str]:
+    """Longest whitespace-normalized innerText per selector, computed in one page round-trip."""
+    result = await page.evaluate(LONGEST_TEXT_PER_SELECTOR_JS, selectors)
+    if not isinstance(result, list):
+        return []
+    return [t if isinstance(t, str) else "" for t in result]
+
+
 async def _fetch_json_via_page(page: Any, api_path: str, payload: dict[str, Any]) -> dict[str, Any]:
     """Call same-origin API from inside browser page context."""
     js = """
@@ -488,6 +765,48 @@ async def _fetch_json_via_page(page: Any, api_path: str, payload: dict[str, Any]
     return {}
 
 
+async def _fetch_target_item_via_page(
+    page: Any,
+    podcast_id: str,
+    target_date: str,
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    """Run corner/detail -> episode/list -> episode/detail in the page.
+
+    Returns (chosen episode item or None, payloads worth adding to the API cache).
+    """
+    payloads: list[dict[str, Any]] = []
+    corner_data = await _fetch_json_via_page(page, "/v1.0/open/corner/detail", {"corner_id": podcast_id})
+    bis_corner_code = str(corner_data.get("bis_corner_code", "")).strip()
+    if not bis_corner_code:
+        return None, payloads
+    ep_list_payload = {
+        "lan_code": "en",
+        "program_type": "radio",
+        "key_word": "corner_code",
+        "word": bis_corner_code,
+        "hit": True,
+        "type": "aod",
+        "page_info": {"row_count": 20, "number": 0},
+    }
+    ep_list = await _fetch_json_via_page(page, "/v1.0/open/media/episode/list", ep_list_payload)
+    items = ep_list.get("item", []) if isinstance(ep_list, dict) else []
+    if not isinstance(items, list):
+        return None, payloads
+    chosen = _pick_item_for_target([x for x in items if isinstance(x, dict)], target_date)
+    if not chosen:
+        return None, payloads
+    script_guess = str(chosen.get("content", "")).strip()
+    if script_guess:
+        payloads.append({"item": [chosen]})
+    # detail endpoint can contain richer content block.
+    ep_id = chosen.get("episode_id")
+    if ep_id:
+        ep_detail = await _fetch_json_via_page(page, "/v1.0/open/media/episode/detail", {"episode_id": ep_id})
+        if isinstance(ep_detail, dict):
+            payloads.append(ep_detail)
+    return chosen, payloads
+
+
 def _pick_item_for_target(
     items: list[dict[str, Any]],
     target_date_yyyymmdd: str,
@@ -497,39 +816,38 @@ def _pick_item_for_target(
     target_date = f"{target_date_yyyymmdd[:4]}-{target_date_yyyymmdd[4:6]}-{target_date_yyyymmdd[6:8]}"
 
     def score(it: dict[str, Any]) -> int:
-        title = str(it.get("title", ""))
+        kinds = _title_slot_kinds(str(it.get("title", "")))
         bdate = str(it.get("broadcast_date", ""))
         s = 0
         if target_date in bdate:
             s += 6
-        if "21:55" in title or "2155" in title:
+        if "hhmm" in kinds:
             s += 5
-        if "10 PM" in title.upper():
+        if "pm" in kinds:
             s += 4
-        if "NEWS" in title.upper():
+        if "news" in kinds:
             s += 2
         if str(it.get("content", "")).strip():
             s += 1
         return s
 
-    ranked = sorted(items, key=score, reverse=True)
-    if score(ranked[0]) <= 0:
+    # One score per item; max keeps the first of equal scores like the stable sort did.
+    best_score, best = max(((score(it), it) for it in items), key=lambda t: t[0])
+    if best_score <= 0:
         return None
-    return ranked[0]
+    return best
 
 
 def _extract_media_url_from_kollus_html(raw_html: str) -> str:
-    text = html.unescape(raw_html or "")
-    patterns = [
-        r'"media_url"\s*:\s*"([^"]+)"',
-        r"'media_url'\s*:\s*'([^']+)'",
-        r"https?://[^\"'\\s]+\\.(?:mp3|mp4)(?:\\?[^\"'\\s]*)?",
-    ]
-    for pat in patterns:
-        m = re.search(pat, text, re.IGNORECASE)
+    text = raw_html or ""
+    # Entity-free bodies (the usual case) skip the full unescape pass.
+    if "&" in text:
+        text = html.unescape(text)
+    for pat in KOLLUS_MEDIA_URL_PATTERNS:
+        m = pat.search(text)
         if m:
             url = m.group(1) if m.groups() else m.group(0)
-            return url.replace("\\/", "/")
+            return url.replace("\\/", "/") if "\\/" in url else url
     return ""
 
 
@@ -538,136 +856,119 @@ def _extract_media_url_from_content_key(content_key: str, cfg: dict[str, Any]) -
     if not content_key:
         return ""
     iframe_url = f"https://v.kr.kollus.com/{content_key}?enable_pip=true"
-    with requests.Session() as session:
-        session.trust_env = False
-        resp = _request_with_retry(session, "GET", iframe_url, cfg)
-        raw = html.unescape(resp.text).replace("\\/", "/")
-        media_url = _extract_media_url_from_kollus_html(raw)
-        if _is_downloadable_audio_url(media_url):
-            return media_url
-        if "m3u8" in (media_url or "").lower():
-            direct = _derive_direct_mp4_from_m3u8(media_url)
-            if _is_downloadable_audio_url(direct):
-                return direct
+    session = _get_session()
+    resp = _request_with_retry(session, "GET", iframe_url, cfg)
+    raw = html.unescape(resp.text).replace("\\/", "/")
+    media_url = _extract_media_url_from_kollus_html(raw)
+    if _is_downloadable_audio_url(media_url):
+        return media_url
+    if "m3u8" in (media_url or "").lower():
+        direct = _derive_direct_mp4_from_m3u8(media_url)
+        if _is_downloadable_audio_url(direct):
+            return direct
     return ""
 
 
 def _fetch_candidates_from_radio_api(cfg: dict[str, Any]) -> list[dict[str, Any]]:
     """Fetch radio podcast candidates via Arirang JSON API (no Playwright)."""
-    target_url = str(_cfg_get(cfg, "crawl.target_url", "https://www.arirang.com/radio/132/podcast/668?lang=en"))
-    with requests.Session() as session:
-        session.trust_env = False
-        corner_payload = {
-            "lan_code": "en",
-            "program_type": "radio",
-            "classify": "content",
-            "is_use_allow": True,
-            "is_open_allow": True,
-        }
-        corner_data = _api_post_json(session, "/v1.0/open/corner/list", corner_payload, cfg)
-        corners = corner_data.get("item", []) if isinstance(corner_data, dict) else []
-        if not isinstance(corners, list):
-            corners = []
-
-        news_corner: dict[str, Any] | None = None
-        for c in corners:
-            if not isinstance(c, dict):
-                continue
-            title = str(c.get("title", "")).strip().lower()
-            if title == "arirang news" or "arirang news" in title:
-                news_corner = c
-                break
-        if not news_corner:
-            return []
-
-        bis_corner_code = str(news_corner.get("bis_corner_code", "")).strip()
-        corner_id = str(news_corner.get("corner_id", "")).strip()
-        if not bis_corner_code:
-            return []
-
-        vod_payload = {
-            "lan_code": "en",
-            "program_type": "radio",
-            "key_word": "corner_code",
-            "word": bis_corner_code,
-            "hit": True,
-            "type": "aod",
-            "page_info": {"row_count": 20, "number": 0},
-        }
-        vod_data = _api_post_json(session, "/v1.0/open/media/vod/list", vod_payload, cfg)
-        items = vod_data.get("item", []) if isinstance(vod_data, dict) else []
-        if not isinstance(items, list):
-            items = []
-
-        episodes: list[dict[str, Any]] = []
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            title = str(it.get("title", "")).strip()
-            bdate = str(it.get("broadcast_date", "")).strip()
-            date_str = _extract_date_yyyymmdd(bdate)
-            airtime = _extract_airtime(f"{title} {bdate}") or "21:55"
-            media_info = it.get("media_info", {}) if isinstance(it.get("media_info", {}), dict) else {}
-            content_key = str(media_info.get("media_content_key", "")).strip()
-            episodes.append(
-                {
-                    "title": title,
-                    "detail_url": target_url,
-                    "date_str": date_str,
-                    "airtime": airtime,
-                    "podcast_id": corner_id or "668",
-                    "corner_id": corner_id,
-                    "bis_corner_code": bis_corner_code,
-                    "vod_id": str(it.get("vod_id", "")).strip(),
-                    "script_text": str(it.get("content", "")).strip(),
-                    "media_content_key": content_key,
-                    "mp3_url_prefetched": "",
-                }
-            )
-        return episodes
+    target_url = _crawl_config(cfg).target_url
+    session = _get_session()
+    corner_payload = {
+        "lan_code": "en",
+        "program_type": "radio",
+        "classify": "content",
+        "is_use_allow": True,
+        "is_open_allow": True,
+    }
+    corner_data = _api_post_json(session, "/v1.0/open/corner/list", corner_payload, cfg)
+    corners = corner_data.get("item", []) if isinstance(corner_data, dict) else []
+    if not isinstance(corners, list):
+        corners = []
+
+    news_corner: dict[str, Any] | None = None
+    for c in corners:
+        if not isinstance(c, dict):
+            continue
+        title = str(c.get("title", "")).strip().lower()
+        if title == "arirang news" or "arirang news" in title:
+            news_corner = c
+            break
+    if not news_corner:
+        return []
+
+    bis_corner_code = str(news_corner.get("bis_corner_code", "")).strip()
+    corner_id = str(news_corner.get("corner_id", "")).strip()
+    if not bis_corner_code:
+        return []
+
+    vod_payload = {
+        "lan_code": "en",
+        "program_type": "radio",
+        "key_word": "corner_code",
+        "word": bis_corner_code,
+        "hit": True,
+        "type": "aod",
+        "page_info": {"row_count": 20, "number": 0},
+    }
+    vod_data = _api_post_json(session, "/v1.0/open/media/vod/list", vod_payload, cfg)
+    items = vod_data.get("item", []) if isinstance(vod_data, dict) else []
+    if not isinstance(items, list):
+        items = []
+
+    episodes: list[dict[str, Any]] = []
+    for it in items:
+        if not isinstance(it, dict):
+            continue
+        title = str(it.get("title", "")).strip()
+        bdate = str(it.get("broadcast_date", "")).strip()
+        date_str = _extract_date_yyyymmdd(bdate)
+        airtime = _extract_airtime(f"{title} {bdate}") or "21:55"
+        media_info = it.get("media_info", {}) if isinstance(it.get("media_info", {}), dict) else {}
+        content_key = str(media_info.get("media_content_key", "")).strip()
+        episodes.append(
+            {
+                "title": title,
+                "detail_url": target_url,
+                "date_str": date_str,
+                "airtime": airtime,
+                "podcast_id": corner_id or "668",
+                "corner_id": corner_id,
+                "bis_corner_code": bis_corner_code,
+                "vod_id": str(it.get("vod_id", "")).strip(),
+                "script_text": str(it.get("content", "")).strip(),
+                "media_content_key": content_key,
+                "mp3_url_prefetched": "",
+            }
+        )
+    return episodes
 
 
 async def _click_target_from_podcast_list(page: Any, date_yyyymmdd: str) -> bool:
     """Click D-1 21:55 item from podcast list on the page."""
     y, m, d = date_yyyymmdd[:4], date_yyyymmdd[4:6], date_yyyymmdd[6:8]
+    # Digits and punctuation only, so no upper-casing is needed to match the JS side.
     date_tokens = [f"{y}-{m}-{d}", f"{y}.{m}.{d}", f"{m}/{d}/{y}", f"{d}/{m}/{y}"]
-    time_tokens = ["21:55", "2155", "10 PM", "10PM", "9:55 PM", "21.55"]
 
-    # Broad candidate containers for list items.
-    candidates = await page.query_selector_all(
-        "li, article, .item, .list-item, .podcast-item, [class*='podcast'], [class*='episode']"
+    # Scan broad candidate containers in the browser and ship back only the winner.
+    pick = await page.evaluate(
+        PODCAST_LIST_PICK_JS,
+        {
+            "selector": PODCAST_LIST_SELECTOR,
+            "clickable": PODCAST_CLICKABLE_SELECTOR,
+            "dateTokens": date_tokens,
+            "timeTokens": PODCAST_TIME_TOKENS_UPPER,
+        },
     )
-    best_date_only = None
-    best_date_only_len = -1
-    for node in candidates:
-        try:
-            text = " ".join((await node.inner_text()).split())
-        except Exception:
-            continue
-        text_u = text.upper()
-        has_date = any(tok.upper() in text_u for tok in date_tokens)
-        has_time = any(tok.upper() in text_u for tok in time_tokens)
-        if has_date and has_time:
-            clickable = await node.query_selector("a, button, [role='button']")
-            if clickable:
-                await clickable.click()
-            else:
-                await node.click()
-            await page.wait_for_timeout(1200)
-            return True
-        if has_date and len(text) > best_date_only_len:
-            best_date_only_len = len(text)
-            best_date_only = node
-
-    if best_date_only:
-        clickable = await best_date_only.query_selector("a, button, [role='button']")
-        if clickable:
-            await clickable.click()
-        else:
-            await best_date_only.click()
-        await page.wait_for_timeout(1200)
-        return True
-    return False
+    if not isinstance(pick, dict) or pick.get("index", -1) < 0:
+        return False
+
+    node = page.locator(PODCAST_LIST_SELECTOR).nth(int(pick["index"]))
+    if pick.get("hasClickable"):
+        await node.locator(PODCAST_CLICKABLE_SELECTOR).first.click()
+    else:
+        await node.click()
+    await page.wait_for_timeout(1200)
+    return True
 
 
 async def _extract_target_script_from_episode_list_ui(
@@ -677,69 +978,58 @@ async def _extract_target_script_from_episode_list_ui(
 ) -> str:
     """Click target row in podcast episode list and read only that episode script."""
     date_iso = f"{target_date_yyyymmdd[:4]}-{target_date_yyyymmdd[4:6]}-{target_date_yyyymmdd[6:8]}"
-    rows = await page.query_selector_all(".playList-wrap li, .info_episodeList_playList li, li.list")
-    target_row = None
-    for row in rows:
-        try:
-            txt = _normalize_space(await row.inner_text())
-        except Exception:
+    # All row texts in one round-trip; matching stays in Python.
+    row_texts = await page.evaluate(INNER_TEXTS_JS, EPISODE_ROW_SELECTOR)
+    target_idx = -1
+    for i, raw in enumerate(row_texts if isinstance(row_texts, list) else []):
+        # date_iso has no whitespace, so test it on the raw text and only normalize likely rows.
+        if not isinstance(raw, str) or date_iso not in raw:
             continue
-        if date_iso in txt and airtime in txt and "Arirang News" in txt:
-            target_row = row
+        txt = _normalize_space(raw)
+        if airtime in txt and "Arirang News" in txt:
+            target_idx = i
             break
 
-    if not target_row:
+    if target_idx < 0:
         return ""
 
     # Open the row details.
-    info_btn = await target_row.query_selector("button.list_info, .list_info")
-    if info_btn:
-        try:
-            await info_btn.click()
+    info_btn = page.locator(EPISODE_ROW_SELECTOR).nth(target_idx).locator("button.list_info, .list_info")
+    try:
+        if await info_btn.count():
+            await info_btn.first.click()
             await page.wait_for_timeout(800)
-        except Exception:
-            pass
+    except Exception:
+        pass
 
     # Read script area dedicated to selected episode.
     script_selectors = [
         ".info_program_content .text",
         ".info_program_content",
     ]
-    texts: list[str] = []
-    for sel in script_selectors:
-        nodes = await page.query_selector_all(sel)
-        for node in nodes:
-            try:
-                t = await node.inner_text()
-            except Exception:
-                continue
-            t = _normalize_space(t)
-            if t:
-                texts.append(t)
-    if not texts:
-        return ""
-    return max(texts, key=len)
+    return max(await _longest_text_per_selector(page, script_selectors), key=len, default="")
 
 
 def _resolve_kollus_media(cfg: dict[str, Any]) -> tuple[str, str, str]:
     """Return (kollus_url, media_url, inferred_date_yyyymmdd) from fallback page."""
-    kollus_url = _cfg_get(cfg, "crawl.kollus_fallback_url", "https://v.kr.kollus.com/lstBUSaP?cdn=arirang-dd")
-    with requests.Session() as session:
-        session.trust_env = False
-        resp = _request_with_retry(session, "GET", kollus_url, cfg)
-        raw = html.unescape(resp.text)
-        media_url = _extract_media_url_from_kollus_html(raw)
-        m_key = re.search(r'"upload_file_key"\s*:\s*"([^"]+)"', raw, re.IGNORECASE)
-        upload_key = m_key.group(1) if m_key else ""
-        m_date = re.search(r"(20\d{6})", upload_key) or re.search(r"/arirang/(20\d{6})/", media_url)
-        inferred = m_date.group(1) if m_date else _get_target_date()[0]
-        return kollus_url, media_url, inferred
+    kollus_url = _crawl_config(cfg).kollus_fallback_url
+    session = _get_session()
+    resp = _request_with_retry(session, "GET", kollus_url, cfg)
+    raw = resp.text
+    if "&" in raw:
+        raw = html.unescape(raw)
+    media_url = _extract_media_url_from_kollus_html(raw)
+    m_key = UPLOAD_FILE_KEY_PATTERN.search(raw)
+    upload_key = m_key.group(1) if m_key else ""
+    m_date = YEAR_DATE8_PATTERN.search(upload_key) or ARIRANG_PATH_DATE_PATTERN.search(media_url)
+    inferred = m_date.group(1) if m_date else _get_target_date()[0]
+    return kollus_url, media_url, inferred
 
 
 def _resolve_kollus_media_with_retry(cfg: dict[str, Any], target_date: str) -> tuple[str, str, str]:
     """Retry resolving fallback media URL to reduce transient failures."""
-    retry_count = int(_cfg_get(cfg, "crawl.media_retry_count", 5))
-    retry_delay = float(_cfg_get(cfg, "crawl.media_retry_delay", 2.0))
+    ccfg = _crawl_config(cfg)
+    retry_count, retry_delay = ccfg.media_retry_count, ccfg.media_retry_delay
 
     last: tuple[str, str, str] = ("", "", target_date)
     for attempt in range(1, retry_count + 1):
@@ -776,20 +1066,18 @@ def _resolve_kollus_media_with_retry(cfg: dict[str, Any], target_date: str) -> t
 async def _async_fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str, Any]:
     """Load podcast page with Playwright and capture script/mp3 via network interception."""
 
-    try:
-        from playwright.async_api import async_playwright  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError("Playwright is required. Install: pip install playwright") from exc
-
     target_url = str(episode.get("detail_url") or "https://www.arirang.com/radio/132/podcast/668?lang=en")
     target_date = str(episode.get("date_str", "")).strip() or _get_target_date()[0]
     mp3_url = ""
     iframe_src = ""
     api_json_cache: list[dict[str, Any]] = []
 
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=True)
-        page = await browser.new_page(user_agent=DEFAULT_HEADERS["User-Agent"])
+    browser = await _get_browser()
+    # Fresh context per episode keeps cookies/cache isolated while Chromium stays warm.
+    context = await browser.new_context(user_agent=DEFAULT_HEADERS["User-Agent"])
+    api_task: asyncio.Task | None = None
+    try:
+        page = await context.new_page()
 
         async def handle_response(response: Any) -> None:
             nonlocal mp3_url
@@ -798,11 +1086,9 @@ async def _async_fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, An
             if _is_downloadable_audio_url(url):
                 mp3_url = url
 
-            if "application/json" in content_type.lower() and any(
-                k in url.lower() for k in ("api", "podcast", "668", "episode")
-            ):
+            if "application/json" in content_type.lower() and RESP_JSON_URL_PATTERN.search(url):
                 try:
-                    data = await response.json()
+                    data = _jloads(await response.body())
                     if isinstance(data, dict):
                         api_json_cache.append(data)
                         if not mp3_url:
@@ -815,56 +1101,25 @@ async def _async_fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, An
                     pass
 
         page.on("response", handle_response)
-        await page.goto(target_url, wait_until="networkidle")
+        # Waiting for networkidle stalls on analytics beacons; wait for the nodes we read instead.
+        ccfg = _crawl_config(cfg)
+        try:
+            await page.goto(target_url, wait_until=ccfg.page_wait_until, timeout=ccfg.nav_timeout_ms)
+        except PlaywrightTimeoutError:
+            LOGGER.warning("Page navigation timed out after %.0f ms; continuing: %s", ccfg.nav_timeout_ms, target_url)
+        if ccfg.page_wait_until != "networkidle":
+            try:
+                await page.wait_for_selector(PAGE_READY_SELECTOR, timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
 
         # 0) Direct browser-context API path used by the frontend route.
         # This is the most reliable way to get script text when DOM parsing is flaky.
+        # It only needs the page origin, so the call chain runs while the list UI work below proceeds.
         podcast_id = str(episode.get("podcast_id", "")).strip() or "668"
-        corner_data = await _fetch_json_via_page(page, "/v1.0/open/corner/detail", {"corner_id": podcast_id})
-        bis_corner_code = str(corner_data.get("bis_corner_code", "")).strip()
-        if bis_corner_code:
-            ep_list_payload = {
-                "lan_code": "en",
-                "program_type": "radio",
-                "key_word": "corner_code",
-                "word": bis_corner_code,
-                "hit": True,
-                "type": "aod",
-                "page_info": {"row_count": 20, "number": 0},
-            }
-            ep_list = await _fetch_json_via_page(page, "/v1.0/open/media/episode/list", ep_list_payload)
-            items = ep_list.get("item", []) if isinstance(ep_list, dict) else []
-            if isinstance(items, list):
-                chosen = _pick_item_for_target([x for x in items if isinstance(x, dict)], target_date)
-                if chosen:
-                    if not mp3_url:
-                        media_info = chosen.get("media_info", {})
-                        if isinstance(media_info, dict):
-                            candidate = str(media_info.get("media_url", "")).strip()
-                            if _is_downloadable_audio_url(candidate):
-                                mp3_url = candidate
-                    if not mp3_url:
-                        urls = _extract_urls_from_obj(chosen)
-                        for candidate in urls:
-                            if _is_downloadable_audio_url(candidate):
-                                mp3_url = candidate
-                                break
-                    script_guess = str(chosen.get("content", "")).strip()
-                    if script_guess:
-                        api_json_cache.append({"item": [chosen]})
-                    # detail endpoint can contain richer content block.
-                    ep_id = chosen.get("episode_id")
-                    if ep_id:
-                        ep_detail = await _fetch_json_via_page(
-                            page,
-                            "/v1.0/open/media/episode/detail",
-                            {"episode_id": ep_id},
-                        )
-                        if isinstance(ep_detail, dict):
-                            api_json_cache.append(ep_detail)
+        api_task = asyncio.create_task(_fetch_target_item_via_page(page, podcast_id, target_date))
 
         # 1) Force-select D-1 21:55 row from podcast list on this page.
-        target_date = str(episode.get("date_str") or _get_target_date()[0])
         clicked = await _click_target_from_podcast_list(page, target_date)
         if clicked:
             await page.wait_for_load_state("networkidle")
@@ -910,50 +1165,60 @@ async def _async_fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, An
             "[class*='transcript']",
             "article p",
         ]
-        collected: list[str] = []
-        for selector in script_selectors:
-            nodes = await page.query_selector_all(selector)
-            texts: list[str] = []
-            for node in nodes:
-                try:
-                    txt = await node.inner_text()
-                    if txt:
-                        texts.append(txt)
-                except Exception:
-                    continue
-            if texts:
-                collected.append(_pick_longest_text(texts))
+        try:
+            chosen, api_payloads = await api_task
+        except Exception as exc:  # noqa: BLE001
+            # A route change from the list click can tear down the fetch's JS context; retry once settled.
+            LOGGER.info("Browser-context API lookup interrupted (%s); retrying", exc)
+            chosen, api_payloads = await _fetch_target_item_via_page(page, podcast_id, target_date)
+        if chosen:
+            if not mp3_url:
+                media_info = chosen.get("media_info", {})
+                if isinstance(media_info, dict):
+                    candidate = str(media_info.get("media_url", "")).strip()
+                    if _is_downloadable_audio_url(candidate):
+                        mp3_url = candidate
+            if not mp3_url:
+                for candidate in _extract_urls_from_obj(chosen):
+                    if _is_downloadable_audio_url(candidate):
+                        mp3_url = candidate
+                        break
+        api_json_cache.extend(api_payloads)
+
+        collected = [t for t in await _longest_text_per_selector(page, script_selectors) if t]
 
         if target_ui_script:
             collected.insert(0, target_ui_script)
-
-        await browser.close()
+    finally:
+        if api_task is not None and not api_task.done():
+            api_task.cancel()
+        await context.close()
 
     script_text = _pick_longest_text(collected)
-    if not script_text:
+    if not script_text or not _is_downloadable_audio_url(mp3_url):
         # JSON fallback for script text/media URL from intercepted API payloads.
-        target_date = str(episode.get("date_str", "")).strip() or _get_target_date()[0]
+        # Already in memory, so it is consulted before any iframe round-trip.
         api_script, api_media = _extract_script_and_media_from_api_cache(api_json_cache, target_date)
-        if api_script:
+        if api_script and not script_text:
             script_text = api_script
         if api_media and not mp3_url:
             mp3_url = api_media
+        elif _is_downloadable_audio_url(api_media) and not _is_downloadable_audio_url(mp3_url):
+            mp3_url = api_media
 
     if script_text:
         script_text = _sanitize_script_source(script_text)
         # Keep only target episode block when playlist text is concatenated.
-        target_date = str(episode.get("date_str", "")).strip() or _get_target_date()[0]
         script_text = _slice_script_by_episode_marker(script_text, target_date, "21:55")
         script_text = _sanitize_script_source(script_text)
 
     if (not mp3_url or not _is_downloadable_audio_url(mp3_url)) and iframe_src:
         try:
-            with requests.Session() as session:
-                session.trust_env = False
-                resp = _request_with_retry(session, "GET", iframe_src, cfg)
-                candidate = _extract_media_url_from_kollus_html(resp.text)
-                if _is_downloadable_audio_url(candidate):
-                    mp3_url = candidate
+            # Off the event loop: other episodes' Playwright work shares this loop.
+            resp = await asyncio.to_thread(_request_with_retry, _get_session(), "GET", iframe_src, cfg)
+            candidate = _extract_media_url_from_kollus_html(resp.text)
+            if _is_downloadable_audio_url(candidate):
+                mp3_url = candidate
         except Exception as exc:  # noqa: BLE001
             LOGGER.warning("Failed to resolve media_url from iframe src: %s", exc)
 
@@ -973,9 +1238,8 @@ async def _async_fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, An
     return enriched
 
 
-def fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str, Any]:
-    """Sync wrapper for async Playwright detail extraction."""
-
+def _prefetched_detail(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the detail when the list step already supplied script (and media), else None."""
     pre_script = _sanitize_script_source(str(episode.get("script_text", "")).strip())
     pre_mp3 = str(episode.get("mp3_url_prefetched", "")).strip()
     if pre_script and _is_downloadable_audio_url(pre_mp3):
@@ -992,9 +1256,19 @@ def fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[s
             enriched["script_text"] = pre_script
             enriched["mp3_url"] = resolved
             return enriched
+    return None
 
+
+def _finish_detail(
+    episode: dict[str, Any],
+    fetched: dict[str, Any] | BaseException,
+    cfg: dict[str, Any],
+) -> dict[str, Any]:
+    """Apply the Kollus fallback to a Playwright detail result (or its failure)."""
     try:
-        enriched = asyncio.run(_async_fetch_episode_detail(episode, cfg))
+        if isinstance(fetched, BaseException):
+            raise fetched
+        enriched = fetched
         mp3 = str(enriched.get("mp3_url", "")).strip()
         target_date = str(enriched.get("date_str", "")).strip() or _get_target_date()[0]
         if not _is_downloadable_audio_url(mp3):
@@ -1029,6 +1303,43 @@ def fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[s
         return enriched
 
 
+async def _async_fetch_many(episodes: list[dict[str, Any]], cfg: dict[str, Any]) -> list[Any]:
+    """Fetch several detail pages concurrently on the shared browser, one context each."""
+    sem = asyncio.Semaphore(max(1, int(_cfg_get(cfg, "crawl.max_concurrency", 4))))
+
+    async def one(ep: dict[str, Any]) -> dict[str, Any]:
+        async with sem:
+            return await _async_fetch_episode_detail(ep, cfg)
+
+    return await asyncio.gather(*(one(ep) for ep in episodes), return_exceptions=True)
+
+
+def fetch_episode_details(episodes: list[dict[str, Any]], cfg: dict[str, Any]) -> list[dict[str, Any]]:
+    """Detail-fetch several episodes, overlapping their Playwright page loads."""
+
+    results: list[dict[str, Any] | None] = [None] * len(episodes)
+    pending: list[int] = []
+    for i, episode in enumerate(episodes):
+        results[i] = _prefetched_detail(episode, cfg)
+        if results[i] is None:
+            pending.append(i)
+
+    if pending:
+        try:
+            fetched = _run_async(_async_fetch_many([episodes[i] for i in pending], cfg))
+        except Exception as exc:  # noqa: BLE001
+            fetched = [exc] * len(pending)
+        for i, res in zip(pending, fetched):
+            results[i] = _finish_detail(episodes[i], res, cfg)
+    return results  # type: ignore[return-value]
+
+
+def fetch_episode_detail(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str, Any]:
+    """Sync wrapper for async Playwright detail extraction."""
+
+    return fetch_episode_details([episode], cfg)[0]
+
+
 def download_episode(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str, Any]:
     """Download txt/mp3/meta files and update logs/download_log.json.
 
@@ -1036,20 +1347,20 @@ def download_episode(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str,
     status == success.
     """
 
-    date_compact, date_display = _get_target_date()
-    date_from_episode = episode.get("date_str", "") or date_compact
-    if re.fullmatch(r"\d{8}", str(date_from_episode)):
-        date_compact = str(date_from_episode)
+    date_from_episode = str(episode.get("date_str", "") or "")
+    if DATE8_PATTERN.fullmatch(date_from_episode):
+        date_compact = date_from_episode
         date_display = f"{date_compact[:4]}-{date_compact[4:6]}-{date_compact[6:8]}"
+    else:
+        date_compact, date_display = _get_target_date()
 
     stem = f"{date_compact}_2155_arirang"
     key = f"{date_compact}_2155"
 
-    download_dir = Path(_cfg_get(cfg, "crawl.download_path", "./downloads"))
-    logs_dir = Path(_cfg_get(cfg, "paths.logs_dir", "logs"))
+    ccfg = _crawl_config(cfg)
+    download_dir = ccfg.download_path
+    logs_dir = ccfg.logs_dir
     logs_path = logs_dir / "download_log.json"
-    download_dir.mkdir(parents=True, exist_ok=True)
-    logs_path.parent.mkdir(parents=True, exist_ok=True)
 
     txt_path = download_dir / f"{stem}.txt"
     mp3_path = download_dir / f"{stem}.mp3"
@@ -1076,9 +1387,9 @@ def download_episode(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str,
         meta_url_date_ok = True
         if meta_ok:
             try:
-                meta_obj = json.loads(meta_path.read_text(encoding="utf-8"))
+                meta_obj = _jloads(meta_path.read_bytes())
                 meta_date_raw = str(meta_obj.get("date", "")).strip()
-                meta_date_compact = re.sub(r"[^0-9]", "", meta_date_raw)[:8]
+                meta_date_compact = NON_DIGIT_PATTERN.sub("", meta_date_raw)[:8]
                 meta_date_ok = meta_date_compact == date_compact
                 meta_mp3_url = str(meta_obj.get("mp3_url", "")).strip()
                 meta_url_date_ok = _is_media_date_match(meta_mp3_url, date_compact)
@@ -1109,6 +1420,11 @@ def download_episode(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str,
             meta_url_date_ok,
         )
 
+    # Only the download path needs the directories; the skip path above is read-only.
+    if not ccfg.dirs_ready:
+        download_dir.mkdir(parents=True, exist_ok=True)
+        logs_path.parent.mkdir(parents=True, exist_ok=True)
+
     script_text = _sanitize_script_source(episode.get("script_text", "") or "")
     mp3_url = episode.get("mp3_url", "") or ""
     if not script_text:
@@ -1123,19 +1439,28 @@ def download_episode(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str,
             f"target={date_compact} media_date={_extract_media_date_yyyymmdd(str(mp3_url))}"
         )
 
-    txt_path.write_text(script_text, encoding="utf-8")
+    txt_path.write_bytes(script_text.encode("utf-8"))
 
     url_lower = mp3_url.lower().split("?", 1)[0]
     audio_ext = ".mp4" if url_lower.endswith(".mp4") else ".mp3"
     audio_path = download_dir / f"{stem}{audio_ext}"
 
-    with requests.Session() as session:
-        session.trust_env = False
-        resp = _request_with_retry(session, "GET", mp3_url, cfg, stream=True)
-        with audio_path.open("wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+    session = _get_session()
+    # Stream into a sibling .part file and rename when complete, so an interrupted
+    # re-download never clobbers a good file or leaves a truncated one under the final name.
+    part_path = audio_path.with_name(audio_path.name + ".part")
+    try:
+        # Audio is already compressed; asking for identity keeps copyfileobj a straight byte copy.
+        with _request_with_retry(
+            session, "GET", mp3_url, cfg, stream=True, headers={"Accept-Encoding": "identity"}
+        ) as resp, part_path.open("wb") as f:
+            # Still let urllib3 undo any Content-Encoding a server applies regardless.
+            resp.raw.decode_content = True
+            shutil.copyfileobj(resp.raw, f, length=DOWNLOAD_CHUNK_BYTES)
+        os.replace(part_path, audio_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
 
     meta = {
         "date": date_display,
@@ -1145,20 +1470,23 @@ def download_episode(episode: dict[str, Any], cfg: dict[str, Any]) -> dict[str,
         "mp3_filename": audio_path.name,
         "source_url": episode.get("detail_url", ""),
         "mp3_url": mp3_url,
-        "downloaded_at": datetime.now(ZoneInfo("Asia/Seoul")).isoformat(),
+        "downloaded_at": datetime.now(_SEOUL_TZ).isoformat(),
     }
-    meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    meta_path.write_bytes(_jdumps(meta))
 
-    history[key] = {
-        "status": "success",
-        "title": episode.get("title", ""),
-        "source_url": episode.get("detail_url", ""),
-        "txt_path": str(txt_path),
-        "mp3_path": str(audio_path),
-        "meta_path": str(meta_path),
-        "updated_at": datetime.now(ZoneInfo("Asia/Seoul")).isoformat(),
-    }
-    _write_download_log(logs_path, history)
+    with _DOWNLOAD_LOG_LOCK:
+        # Re-read under the lock so concurrent backfill crawls do not drop each other's entries.
+        history = _ensure_download_log(logs_path)
+        history[key] = {
+            "status": "success",
+            "title": episode.get("title", ""),
+            "source_url": episode.get("detail_url", ""),
+            "txt_path": str(txt_path),
+            "mp3_path": str(audio_path),
+            "meta_path": str(meta_path),
+            "updated_at": datetime.now(_SEOUL_TZ).isoformat(),
+        }
+        _write_download_log(logs_path, history)
 
     downloaded = dict(episode)
     downloaded.update(
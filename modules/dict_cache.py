@@ -0,0 +1,142 @@
+"""Persistent SQLite cache for dictionary lookups (lemma -> JSON payload)."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+_TABLE_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz_")
+
+# Kept out of logs/ (committed by the daily workflow); relative dirs resolve against the project root.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = ".cache"
+DICT_CACHE_FILENAME = "dict_cache.sqlite3"
+
+_CACHE_DIR: str | Path | None = None
+
+
+def set_dict_cache_dir(cache_dir: str | Path | None) -> None:
+    """Set the process-wide `paths.cache_dir` used when no explicit dir is passed."""
+    global _CACHE_DIR
+    _CACHE_DIR = cache_dir
+
+
+def dict_cache_path(cache_dir: str | Path | None = None) -> Path:
+    """Return the SQLite file for `paths.cache_dir` (default: the configured dir, else <project>/.cache)."""
+    base = Path(cache_dir or _CACHE_DIR or DEFAULT_CACHE_DIR)
+    if not base.is_absolute():
+        base = PROJECT_ROOT / base
+    return base / DICT_CACHE_FILENAME
+
+
+class DictCache:
+    """Small key/value store backed by one SQLite table.
+
+    One connection is shared across threads behind a lock; WAL keeps writes cheap.
+    """
+
+    def __init__(self, db_path: str | Path, table: str = "api_cache") -> None:
+        if not table or not set(table) <= _TABLE_NAME_CHARS:
+            raise ValueError(f"Invalid cache table name: {table!r}")
+        self.db_path = Path(db_path)
+        self.table = table
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table}(lemma TEXT PRIMARY KEY, payload BLOB, ts INTEGER)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        rows: list[tuple[str, Any]] = []
+        try:
+            with self._lock:
+                # Stay well under SQLite's bound-parameter limit.
+                for i in range(0, len(keys), 500):
+                    chunk = keys[i : i + 500]
+                    marks = ",".join("?" * len(chunk))
+                    rows.extend(
+                        self._conn.execute(
+                            f"SELECT lemma, payload FROM {self.table} WHERE lemma IN ({marks})",
+                            chunk,
+                        ).fetchall()
+                    )
+        except sqlite3.Error as exc:
+            LOGGER.warning("Dictionary cache read failed: %s", exc)
+        out: dict[str, dict[str, Any]] = {}
+        for lemma, payload in rows:
+            try:
+                out[lemma] = json.loads(payload)
+            except (TypeError, ValueError):
+                continue
+        return out
+
+    def close(self) -> None:
+        """Fold the WAL back into the main file and close, leaving no -wal/-shm behind."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as exc:
+                LOGGER.warning("Dictionary cache checkpoint failed: %s", exc)
+            finally:
+                self._conn.close()
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, dict[str, Any]]) -> None:
+        if not items:
+            return
+        now = int(time.time())
+        rows = [(k, json.dumps(v, ensure_ascii=False), now) for k, v in items.items()]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table}(lemma, payload, ts) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._conn.commit()
+        except sqlite3.Error as exc:
+            LOGGER.warning("Dictionary cache write failed: %s", exc)
+
+
+_CACHES: dict[tuple[str, str], DictCache | None] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_dict_cache(db_path: str | Path, table: str = "api_cache") -> DictCache | None:
+    """Return a process-wide cache for (db_path, table); None if SQLite is unusable."""
+    key = (str(Path(db_path).resolve()), table)
+    with _CACHES_LOCK:
+        if key not in _CACHES:
+            try:
+                _CACHES[key] = DictCache(db_path, table=table)
+            except (OSError, sqlite3.Error) as exc:
+                LOGGER.warning("Dictionary cache disabled (%s): %s", db_path, exc)
+                _CACHES[key] = None
+        return _CACHES[key]
+
+
+def close_dict_caches() -> None:
+    """Close every cache opened via get_dict_cache (safe to call more than once)."""
+    with _CACHES_LOCK:
+        caches = [c for c in _CACHES.values() if c is not None]
+        _CACHES.clear()
+    for cache in caches:
+        cache.close()
@@ -10,14 +10,69 @@ Translation APIs (Google/DeepL/Papago) are intentionally not used.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Literal
+import threading
+from typing import Any, Literal
 
 import requests
 from nltk.corpus import wordnet as wn
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .dict_cache import dict_cache_path, get_dict_cache
 
 DefinitionSource = Literal["wordnet", "free_dictionary_api", "none"]
 
+# Same SQLite file the analyzer uses (paths.cache_dir via set_dict_cache_dir), resolved per call
+# so the configured dir applies even when this module was imported first; lru_cache stays in front as L1.
+DICT_CACHE_TABLE = "dictionary"
+FREE_DICT_API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+# Batch lookups fan out on this many threads, but at most FREE_DICT_API_SLOTS hit the API at once.
+DEFINITION_MAX_WORKERS = 8
+FREE_DICT_API_SLOTS = 4
+
+_FREE_DICT_API_SEMAPHORE = threading.BoundedSemaphore(FREE_DICT_API_SLOTS)
+
+_HTTP_SESSION: requests.Session | None = None
+_HTTP_SESSION_LOCK = threading.Lock()
+# NLTK's WordNet reader seeks/reads a shared file handle without locking; serialise corpus access.
+_WORDNET_LOCK = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Shared keep-alive session so repeated lookups reuse one TCP/TLS connection."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                session = requests.Session()
+                retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def _cache_get(key: str) -> dict[str, Any] | None:
+    store = get_dict_cache(dict_cache_path(), table=DICT_CACHE_TABLE)
+    return store.get(key) if store is not None else None
+
+
+def _cache_set(key: str, value: dict[str, Any]) -> None:
+    store = get_dict_cache(dict_cache_path(), table=DICT_CACHE_TABLE)
+    if store is not None:
+        store.set(key, value)
+
+
+@lru_cache(maxsize=4096)
+def _synsets(w: str) -> tuple[Any, ...]:
+    """WordNet synsets for a normalized word, shared by both helpers below.
+
+    LookupError (corpus missing) propagates and is not cached.
+    """
+    with _WORDNET_LOCK:
+        return tuple(wn.synsets(w))
+
 
 @lru_cache(maxsize=4096)
 def get_korean_meaning(word: str) -> str:
@@ -26,19 +81,28 @@ def get_korean_meaning(word: str) -> str:
     if not w:
         return ""
 
+    key = f"ko:{w}"
+    cached = _cache_get(key)
+    if cached is not None:
+        return str(cached.get("ko", ""))
+
     try:
-        synsets = wn.synsets(w)
+        synsets = _synsets(w)
     except LookupError:
         return ""
 
-    for syn in synsets:
-        try:
-            kor_lemmas = syn.lemma_names("kor")
-        except Exception:
-            kor_lemmas = []
-        if kor_lemmas:
-            return kor_lemmas[0].replace("_", " ")
-    return ""
+    meaning = ""
+    with _WORDNET_LOCK:
+        for syn in synsets:
+            try:
+                kor_lemmas = syn.lemma_names("kor")
+            except Exception:
+                kor_lemmas = []
+            if kor_lemmas:
+                meaning = kor_lemmas[0].replace("_", " ")
+                break
+    _cache_set(key, {"ko": meaning})
+    return meaning
 
 
 @lru_cache(maxsize=4096)
@@ -48,25 +112,51 @@ def get_english_definition(word: str, timeout_sec: int = 4) -> tuple[str, Defini
     if not w:
         return "", "none"
 
+    key = f"en:{w}"
+    cached = _cache_get(key)
+    if cached is not None:
+        return str(cached.get("definition", "")), cached.get("source", "none")
+
     try:
-        synsets = wn.synsets(w)
+        synsets = _synsets(w)
     except LookupError:
-        synsets = []
+        synsets = ()
 
     if synsets:
-        return synsets[0].definition(), "wordnet"
+        with _WORDNET_LOCK:
+            definition = synsets[0].definition()
+        _cache_set(key, {"definition": definition, "source": "wordnet"})
+        return definition, "wordnet"
 
     try:
-        url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{w}"
-        resp = requests.get(url, timeout=timeout_sec)
+        with _FREE_DICT_API_SEMAPHORE:
+            resp = _get_http_session().get(FREE_DICT_API_URL.format(word=w), timeout=timeout_sec)
         if resp.ok:
             data = resp.json()
             for entry in data:
                 for meaning in entry.get("meanings", []):
                     defs = meaning.get("definitions", [])
                     if defs and defs[0].get("definition"):
-                        return defs[0]["definition"], "free_dictionary_api"
+                        definition = defs[0]["definition"]
+                        _cache_set(key, {"definition": definition, "source": "free_dictionary_api"})
+                        return definition, "free_dictionary_api"
     except Exception:
         pass
 
+    # Misses are not persisted: they may be transient network failures.
     return "", "none"
+
+
+def get_english_definitions(
+    words: list[str], timeout_sec: int = 4, max_workers: int = DEFINITION_MAX_WORKERS
+) -> list[tuple[str, DefinitionSource]]:
+    """Batch form of get_english_definition (same order as `words`), overlapping API waits.
+
+    WordNet access is serialised by _WORDNET_LOCK; only the Free Dictionary fallback overlaps.
+    """
+    unique = list(dict.fromkeys(w for w in words if w.strip()))
+    found: dict[str, tuple[str, DefinitionSource]] = {}
+    if unique:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as pool:
+            found.update(zip(unique, pool.map(lambda w: get_english_definition(w, timeout_sec), unique)))
+    return [found.get(w, ("", "none")) for w in words]
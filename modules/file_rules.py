@@ -6,7 +6,15 @@ from dataclasses import dataclass
 from pathlib import Path
 import re
 
-STEM_RE = re.compile(r"^(?P<date>\d{8})_(?P<time>\d{4})_(?P<tag>[a-z0-9_-]+)$")
+# Matched with fullmatch (anchored at both ends, no trailing-newline leniency).
+STEM_RE = re.compile(r"(?P<date>\d{8})_(?P<time>\d{4})_(?P<tag>[a-z0-9_-]+)")
+# Bundle field -> filename suffix appended to the stem.
+BUNDLE_SUFFIXES = (
+    ("script_txt", ".txt"),
+    ("audio_mp3", ".mp3"),
+    ("report_html", ".html"),
+    ("meta_json", "_meta.json"),
+)
 
 
 @dataclass(frozen=True)
@@ -35,16 +43,17 @@ def build_file_bundle(base_dir: str | Path, date_yyyymmdd: str, time_hhmm: str,
 
 
 def validate_stem(stem: str) -> bool:
-    return STEM_RE.match(stem) is not None
+    return STEM_RE.fullmatch(stem) is not None
 
 
 def validate_bundle(paths: BuildFiles) -> bool:
     stem = paths.stem
     if not validate_stem(stem):
         return False
-    return (
-        paths.script_txt.name == f"{stem}.txt"
-        and paths.audio_mp3.name == f"{stem}.mp3"
-        and paths.report_html.name == f"{stem}.html"
-        and paths.meta_json.name == f"{stem}_meta.json"
-    )
+    # Compare prefix/suffix in place rather than formatting the expected names.
+    n_stem = len(stem)
+    for field, suffix in BUNDLE_SUFFIXES:
+        name = getattr(paths, field).name
+        if len(name) != n_stem + len(suffix) or not name.startswith(stem) or not name.endswith(suffix):
+            return False
+    return True